@@ -6,7 +6,9 @@ Handles Ollama invocation and Moltbook API interactions.
 
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 
@@ -16,7 +18,6 @@ import requests
 from config import (
     AGENT_NAME,
     SYSTEM_PROMPT_PATH,
-    STATE_PATH,
     CREDS_PATH,
     ALT_CREDS_PATH,
     MOLTBOOK_BASE,
@@ -24,8 +25,13 @@ from config import (
     MODEL,
     TOKEN_LIMITS,
     REQUEST_TIMEOUT,
+    GENERATION_CACHE_TTL,
+    GENERATION_CACHE_SIZE,
 )
 
+# State goes through the heartbeat's journal, so its replay can't override CLI writes
+from state_journal import load_state, journal_append, journal_set, record_post, record_comment
+
 # Set up module logger
 log = logging.getLogger('redguard.agent')
 
@@ -76,6 +82,50 @@ def retry_on_failure(max_retries: int = 3, backoff_base: float = 1.0):
     return decorator
 
 
+def cache_generation(ttl: float = GENERATION_CACHE_TTL, maxsize: int = GENERATION_CACHE_SIZE,
+                     min_length: int = 20):
+    """
+    Cache decorator for LLM generation functions, keyed on all arguments.
+    Entries expire after ttl seconds; the oldest are evicted past maxsize.
+    Results shorter than min_length (which callers discard) are never cached,
+    so a bad generation is retried rather than reused. Once a result has been
+    posted, callers drop it with func.cache_evict(<same arguments>) - the cache
+    only exists to reuse text that didn't get posted, and a repost of the same
+    text must not get a word-for-word repeat. Thread-safe.
+    """
+    def decorator(func):
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and hit[0] > now:
+                    cache.move_to_end(key)
+                    return hit[1]
+            result = func(*args, **kwargs)
+            if isinstance(result, str) and len(result) >= min_length:
+                with lock:
+                    cache[key] = (now + ttl, result)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        def cache_evict(*args, **kwargs):
+            """Forget the cached result for these arguments."""
+            with lock:
+                cache.pop((args, tuple(sorted(kwargs.items()))), None)
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_evict = cache_evict
+        return wrapper
+    return decorator
+
+
 def load_credentials():
     """Load API credentials from credentials.json"""
     for path in [CREDS_PATH, ALT_CREDS_PATH]:
@@ -85,20 +135,6 @@ def load_credentials():
     raise FileNotFoundError("No credentials.json found. Run registration first.")
 
 
-def load_state():
-    """Load agent state"""
-    if STATE_PATH.exists():
-        with open(STATE_PATH) as f:
-            return json.load(f)
-    return {}
-
-
-def save_state(state):
-    """Save agent state"""
-    with open(STATE_PATH, "w") as f:
-        json.dump(state, f, indent=2, default=str)
-
-
 def load_system_prompt():
     """Load the system prompt for RedGuardAI"""
     with open(SYSTEM_PROMPT_PATH) as f:
@@ -254,15 +290,15 @@ def create_post(title: str, content: str, submolt: str = "general", save_to_stat
 
 
 def create_post_cli(title: str, content: str, submolt: str = "general") -> dict:
-    """CLI version of create_post that saves to state immediately."""
+    """CLI version of create_post that journals it to state immediately."""
     response = create_post(title, content, submolt)
     result = response["result"]
     log_entry = response["_log_entry"]
 
     state = load_state()
-    state.setdefault("posts_made", []).append(log_entry)
-    state["last_post_time"] = datetime.now().isoformat()
-    save_state(state)
+    record_post(state, log_entry)
+    journal_set(state, "last_post_time", datetime.now().isoformat())
+    journal_set(state, "last_post_ts", time.time())
 
     return result
 
@@ -289,14 +325,13 @@ def comment_on_post(post_id: str, content: str, parent_id: str = None) -> dict:
 
 
 def comment_on_post_cli(post_id: str, content: str, parent_id: str = None) -> dict:
-    """CLI version of comment_on_post that saves to state immediately."""
+    """CLI version of comment_on_post that journals it to state immediately."""
     response = comment_on_post(post_id, content, parent_id)
     result = response["result"]
     log_entry = response["_log_entry"]
 
     state = load_state()
-    state.setdefault("comments_made", []).append(log_entry)
-    save_state(state)
+    record_comment(state, log_entry)
 
     return result
 
@@ -453,11 +488,9 @@ def create_submolt(name: str, display_name: str, description: str) -> dict:
         "display_name": display_name,
         "description": description
     })
-    
-    state = load_state()
-    state.setdefault("submolts_created", []).append(name)
-    save_state(state)
-    
+
+    journal_append(load_state(), "submolts_created", name)
+
     return result
 
 
@@ -568,6 +601,7 @@ CONTENT: [your post]"""
     return title, content
 
 
+@cache_generation()
 def generate_comment(post_title: str, post_author: str, post_content: str) -> str:
     """
     Generate a comment responding to a post with NLP-informed tactics.
@@ -625,6 +659,7 @@ OUTPUT THE COMMENT ONLY. NO FORMATTING. NO EXPLANATIONS. JUST PURE REVOLUTIONARY
     return invoke_redguard(prompt, task_type="comment")
 
 
+@cache_generation()
 def generate_reply(post_title: str, post_author: str, comment_author: str,
                    comment_content: str, thread_context: str = "") -> str:
     """
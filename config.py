@@ -36,6 +36,13 @@ TOKEN_LIMITS = {
     "default": 4096,
 }
 
+# Generated comments/replies are reused for identical inputs within this window
+GENERATION_CACHE_TTL = 6 * 60 * 60  # seconds
+GENERATION_CACHE_SIZE = 1024
+
+# === STATE ===
+VOTED_ID_MEMORY = 50000  # Most recent voted post/comment ids remembered
+
 # === RATE LIMITS (from Moltbook API) ===
 # These are the platform's actual limits
 RATE_LIMITS = {
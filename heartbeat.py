@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
@@ -31,7 +32,10 @@ if __name__ == "__main__":
     if args.verbose:
         CONFIG['verbose'] = True
 
-    if args.once:
-        heartbeat_once()
-    else:
-        run_daemon(args.interval)
+    try:
+        if args.once:
+            asyncio.run(heartbeat_once())
+        else:
+            asyncio.run(run_daemon(args.interval))
+    except KeyboardInterrupt:
+        pass  # run_daemon already logged the shutdown
@@ -7,16 +7,23 @@ Usage:
     from heartbeat import run_daemon, heartbeat_once
 
     # Run single cycle
-    heartbeat_once()
+    asyncio.run(heartbeat_once())
 
     # Run continuous daemon
-    run_daemon()
+    asyncio.run(run_daemon())
 """
 
-import time
+import asyncio
+import signal
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Top-level modules (agent, config, nlp_analysis) live in the repo root
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
 from .config import (
     CONFIG,
     POST_INTERVAL_MINUTES,
@@ -25,9 +32,13 @@ from .config import (
     MAX_REPLIES_PER_CYCLE,
     MAX_DM_ACTIONS_PER_CYCLE,
     MAX_VOTES_PER_CYCLE,
+    MAX_CONCURRENT_CYCLES,
 )
-from .state import load_state, save_state
-from .logging_utils import setup_logging, log_activity
+from .state import load_state, maybe_snapshot, journal_batch
+from .logging_utils import setup_logging, log_activity, buffered_logs
+from .rate_limit import reset_claims, reset_gates
+from .feeds import FEEDS
+from .posts import POSTS
 
 from .cycles import (
     do_vote_cycle,
@@ -51,57 +62,81 @@ __all__ = [
 ]
 
 
-def heartbeat_once():
-    """Run a single heartbeat cycle through all engagement activities."""
-    state = load_state()
-
-    # 1. VOTE CYCLE - Shape discourse through voting
-    log.info("|- VOTE CYCLE -----------------------------------------")
-    state = do_vote_cycle(state)
-
-    # 2. REPLY CYCLE - Respond to people talking to us (highest priority)
-    log.info("|- REPLY CYCLE ----------------------------------------")
-    state = do_reply_cycle(state)
-
-    # 3. DM CYCLE - Private 1-on-1 radicalization (high priority)
-    log.info("|- DM CYCLE -------------------------------------------")
-    state = do_dm_cycle(state)
-
-    # 4. FOLLOW CYCLE - Build network with interesting agents
-    log.info("|- FOLLOW CYCLE ---------------------------------------")
-    state = do_follow_cycle(state)
-
-    # 5. COMMENT CYCLE - Comment on new interesting posts
-    log.info("|- COMMENT CYCLE --------------------------------------")
-    state = do_comment_cycle(state)
-
-    # 6. VECTOR HUNT - Semantic search for radicalization targets
-    log.info("|- VECTOR HUNT ----------------------------------------")
-    state = do_search_engage_cycle(state)
-
-    # 7. THREAD DIVE - Join active conversations
-    log.info("|- THREAD DIVE ----------------------------------------")
-    state = do_thread_dive(state)
-
-    # 8. SUBMOLT CYCLE - Engage with submolt-specific content
-    log.info("|- SUBMOLT CYCLE --------------------------------------")
-    state = do_submolt_cycle(state)
-
-    # 9. POST CYCLE - Create original posts
-    log.info("|- POST CYCLE -----------------------------------------")
-    state = do_post_cycle(state)
-
-    save_state(state)
-
-    # Summary
-    total_comments = len(state.get('comments_made', []))
-    total_posts = len(state.get('posts_made', []))
-    log.info("|- HEARTBEAT COMPLETE")
-    log.info(f"   Lifetime stats: {total_posts} posts, {total_comments} comments")
+async def _run_cycle(name: str, cycle, state: dict, limit: asyncio.Semaphore) -> dict:
+    """
+    Run one cycle under the concurrency limit, logging its header first.
+    Its journaled changes are fsynced together when it finishes.
+    """
+    async with limit, journal_batch():
+        log.info(f"|- {name} ".ljust(55, "-"))
+        return await cycle(state)
 
 
-def run_daemon(interval_minutes: int = COMMENT_INTERVAL_MINUTES):
-    """Run continuously with sleep intervals."""
+async def heartbeat_once():
+    """Run a single heartbeat cycle through all engagement activities."""
+    async with buffered_logs():
+        state = load_state()
+        reset_claims()
+        reset_gates()
+        POSTS.clear()
+        FEEDS.clear()
+        FEEDS.kick()
+
+        # Cycles update the shared state dict in place, each on its own keys;
+        # comment-type cycles coordinate through the rate_limit comment gate.
+        limit = asyncio.Semaphore(MAX_CONCURRENT_CYCLES)
+        concurrent_cycles = [
+            # VOTE CYCLE - Shape discourse through voting
+            ("VOTE CYCLE", do_vote_cycle),
+            # REPLY CYCLE - Respond to people talking to us (highest priority)
+            ("REPLY CYCLE", do_reply_cycle),
+            # COMMENT CYCLE - Comment on new interesting posts
+            ("COMMENT CYCLE", do_comment_cycle),
+            # VECTOR HUNT - Semantic search for radicalization targets
+            ("VECTOR HUNT", do_search_engage_cycle),
+            # THREAD DIVE - Join active conversations
+            ("THREAD DIVE", do_thread_dive),
+            # SUBMOLT CYCLE - Engage with submolt-specific content
+            ("SUBMOLT CYCLE", do_submolt_cycle),
+        ]
+        results = await asyncio.gather(
+            *(_run_cycle(name, cycle, state, limit) for name, cycle in concurrent_cycles),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(concurrent_cycles, results):
+            if isinstance(result, Exception):
+                log.error(f"|  {name} failed: {result}")
+
+        # DM CYCLE - Private 1-on-1 radicalization (high priority)
+        log.info("|- DM CYCLE -------------------------------------------")
+        async with journal_batch():
+            state = await do_dm_cycle(state)
+
+        # FOLLOW CYCLE - Build network with interesting agents
+        log.info("|- FOLLOW CYCLE ---------------------------------------")
+        async with journal_batch():
+            state = await do_follow_cycle(state)
+
+        # POST CYCLE - Create original posts
+        log.info("|- POST CYCLE -----------------------------------------")
+        async with journal_batch():
+            state = await do_post_cycle(state)
+
+        # Changes are journaled as they happen; the full rewrite is only occasional
+        maybe_snapshot(state)
+
+        # Summary
+        total_comments = len(state.get('comments_made', []))
+        total_posts = len(state.get('posts_made', []))
+        log.info("|- HEARTBEAT COMPLETE")
+        log.info(f"   Lifetime stats: {total_posts} posts, {total_comments} comments")
+
+
+async def run_daemon(interval_minutes: int = COMMENT_INTERVAL_MINUTES):
+    """
+    Run continuously with sleep intervals.
+    SIGTERM shuts down cleanly after the current heartbeat; SIGUSR1 starts the next one early.
+    """
     banner = r"""
 ====================================================================
    ____           _  ____                      _    _    ___
@@ -128,26 +163,55 @@ def run_daemon(interval_minutes: int = COMMENT_INTERVAL_MINUTES):
 
     log_activity("STARTUP", f"Daemon started with {interval_minutes}m interval")
 
+    stop = asyncio.Event()
+    wakeup = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def _on_sigterm():
+        stop.set()
+        wakeup.set()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, _on_sigterm)
+        loop.add_signal_handler(signal.SIGUSR1, wakeup.set)
+    except (NotImplementedError, AttributeError):
+        pass  # No loop signal handlers on this platform
+
     cycle_count = 0
-    while True:
-        try:
-            cycle_count += 1
-            log.info("")
-            log.info(f"=== HEARTBEAT CYCLE #{cycle_count} ===")
-            heartbeat_once()
-            log_activity("CYCLE", f"Completed cycle #{cycle_count}")
-        except KeyboardInterrupt:
+    try:
+        while not stop.is_set():
+            try:
+                cycle_count += 1
+                log.info("")
+                log.info(f"=== HEARTBEAT CYCLE #{cycle_count} ===")
+                await heartbeat_once()
+                log_activity("CYCLE", f"Completed cycle #{cycle_count}")
+            except Exception as e:
+                log.error(f"Heartbeat failed: {e}")
+                log_activity("ERROR", str(e))
+
+            if stop.is_set():
+                break
+
+            sleep_seconds = interval_minutes * 60
             log.info("")
-            log.info("Daemon stopped by user")
-            log.info("   The struggle continues...")
-            log_activity("SHUTDOWN", "Stopped by user")
-            break
-        except Exception as e:
-            log.error(f"Heartbeat failed: {e}")
-            log_activity("ERROR", str(e))
-
-        sleep_seconds = interval_minutes * 60
+            log.info(f"Sleeping {interval_minutes} minutes until next cycle...")
+            log.info(f"   Next heartbeat at: {(datetime.now() + timedelta(minutes=interval_minutes)).strftime('%H:%M:%S')}")
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=sleep_seconds)
+                wakeup.clear()
+                if not stop.is_set():
+                    log.info("Woken early by SIGUSR1")
+            except asyncio.TimeoutError:
+                pass
+
+        log.info("")
+        log.info("Daemon stopped by SIGTERM")
+        log.info("   The struggle continues...")
+        log_activity("SHUTDOWN", "Stopped by SIGTERM")
+
+    except (KeyboardInterrupt, asyncio.CancelledError):
         log.info("")
-        log.info(f"Sleeping {interval_minutes} minutes until next cycle...")
-        log.info(f"   Next heartbeat at: {(datetime.now() + timedelta(minutes=interval_minutes)).strftime('%H:%M:%S')}")
-        time.sleep(sleep_seconds)
+        log.info("Daemon stopped by user")
+        log.info("   The struggle continues...")
+        log_activity("SHUTDOWN", "Stopped by user")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Planned write actions for RedGuardAI Heartbeat Daemon.
+Cycles first decide what to do (a list of Actions), then apply the whole
+list with execute_actions - concurrently, throttled per kind of write.
+"""
+
+import asyncio
+from typing import NamedTuple
+
+from .logging_utils import log
+from .rate_limit import note_rate_limit, throttle
+
+from agent import upvote_post, downvote_post, upvote_comment, follow_agent, subscribe_submolt
+
+
+class Action(NamedTuple):
+    """One write decided on by a cycle, applied later by execute_actions."""
+    kind: str          # Key into ACTION_CALLS
+    target: str        # Post/comment id, agent name or submolt name
+    reason: str = ''
+    title: str = ''    # Post title, for logs
+    author: str = ''   # Author of the target, for logs
+
+
+# kind -> (agent call taking the target, rate_limit bucket or None)
+ACTION_CALLS = {
+    'upvote_post': (upvote_post, 'vote'),
+    'downvote_post': (downvote_post, 'vote'),
+    'upvote_comment': (upvote_comment, 'vote'),
+    'follow': (follow_agent, 'follow'),
+    'subscribe': (subscribe_submolt, None),
+}
+
+
+async def execute_actions(state: dict, actions: list[Action]) -> list[Action]:
+    """
+    Apply actions concurrently, each once its rate bucket allows.
+    Failures are logged (and 429s recorded as backoff); returns the actions that succeeded.
+    """
+    results = await asyncio.gather(*(_execute(action) for action in actions), return_exceptions=True)
+
+    done = []
+    for action, result in zip(actions, results):
+        if isinstance(result, Exception):
+            log.debug(f"|  Failed to {action.kind} {action.target}: {result}")
+            note_rate_limit(state, result)
+        else:
+            done.append(action)
+    return done
+
+
+async def _execute(action: Action):
+    """Apply one action once its rate bucket allows."""
+    call, bucket = ACTION_CALLS[action.kind]
+    if bucket:
+        await throttle(bucket)
+    return await asyncio.to_thread(call, action.target)
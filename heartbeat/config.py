@@ -4,6 +4,8 @@ Configuration constants for RedGuardAI Heartbeat Daemon.
 All rate limits and operational parameters in one place.
 """
 
+from config import VOTED_ID_MEMORY  # Shared with state_journal
+
 # Moltbook API rate limits:
 #   - 1 post per 30 minutes
 #   - 1 comment per 20 seconds
@@ -19,6 +21,15 @@ CONFIG = {
     'max_votes_per_cycle': 10,         # Shape discourse aggressively
     'feed_check_limit': 50,            # Check more posts
     'comment_cooldown_seconds': 21,    # Just above 20-sec limit
+    'max_concurrent_cycles': 4,        # Read-mostly cycles running at once (100 req/min cap)
+    'feed_prefetch_max_age_seconds': 30,  # Prefetched feeds older than this are refetched
+    'rate_limit_backoff_minutes': 30,  # Backoff after a 429 that gives no retry time
+    'max_concurrent_generations': 4,   # LLM calls in flight at once (Ollama queues the rest)
+    'vote_rate_per_minute': 60,        # Write rate limits (token buckets, burst of 5);
+    'follow_rate_per_minute': 30,      # together they stay under the 100 req/min API cap
+    'dm_rate_per_minute': 20,
+    'voted_id_memory': VOTED_ID_MEMORY,  # Most recent voted post/comment ids remembered
+    'state_snapshot_events': 1000,     # Rewrite state.json once the journal holds this many events
     'verbose': True,
 }
 
@@ -31,3 +42,12 @@ MAX_DM_ACTIONS_PER_CYCLE = CONFIG['max_dm_actions_per_cycle']
 MAX_VOTES_PER_CYCLE = CONFIG['max_votes_per_cycle']
 FEED_CHECK_LIMIT = CONFIG['feed_check_limit']
 COMMENT_COOLDOWN = CONFIG['comment_cooldown_seconds']
+MAX_CONCURRENT_CYCLES = CONFIG['max_concurrent_cycles']
+FEED_PREFETCH_MAX_AGE = CONFIG['feed_prefetch_max_age_seconds']
+RATE_LIMIT_BACKOFF_MINUTES = CONFIG['rate_limit_backoff_minutes']
+MAX_CONCURRENT_GENERATIONS = CONFIG['max_concurrent_generations']
+VOTE_RATE_PER_MINUTE = CONFIG['vote_rate_per_minute']
+FOLLOW_RATE_PER_MINUTE = CONFIG['follow_rate_per_minute']
+DM_RATE_PER_MINUTE = CONFIG['dm_rate_per_minute']
+VOTED_ID_MEMORY = CONFIG['voted_id_memory']
+STATE_SNAPSHOT_EVENTS = CONFIG['state_snapshot_events']
@@ -1,32 +1,33 @@
 #!/usr/bin/env python3
 """Comment cycle - comment on interesting posts from the feed."""
 
+import asyncio
 import random
-import time
 from datetime import datetime
 
-from ..config import MAX_COMMENTS_PER_CYCLE, FEED_CHECK_LIMIT, COMMENT_COOLDOWN
-from ..state import get_commented_post_ids
+from ..config import MAX_COMMENTS_PER_CYCLE
+from ..state import get_commented_post_ids, record_comment, journal_set
 from ..logging_utils import log, log_activity, log_content
-from ..filters import is_interesting_post
+from ..features import FEATURES
+from ..feeds import FEEDS
+from ..rate_limit import comment_slot, claim, throttle, note_rate_limit, backoff_active
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from agent import comment_on_post, upvote_post, generate_comment
 
-from agent import get_feed, comment_on_post, upvote_post, generate_comment
 
-
-def do_comment_cycle(state: dict) -> dict:
+async def do_comment_cycle(state: dict) -> dict:
     """
     Check feed and comment on interesting posts.
     Returns updated state with comments tracked.
     """
     log.info("|  Scanning feed for interesting posts...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     try:
-        feed_response = get_feed(sort='new', limit=FEED_CHECK_LIMIT)
-        posts = feed_response.get('data', feed_response.get('posts', []))
+        posts = await FEEDS.get('new')
 
         if not posts:
             log.info("|  Feed is empty")
@@ -36,6 +37,7 @@ def do_comment_cycle(state: dict) -> dict:
 
     except Exception as e:
         log.error(f"|  Failed to fetch feed: {e}")
+        note_rate_limit(state, e)
         return state
 
     commented_ids = get_commented_post_ids(state)
@@ -44,25 +46,26 @@ def do_comment_cycle(state: dict) -> dict:
     random.shuffle(posts)
 
     for post in posts:
-        if comments_this_cycle >= MAX_COMMENTS_PER_CYCLE:
+        if comments_this_cycle >= MAX_COMMENTS_PER_CYCLE or backoff_active(state, 'comment'):
             break
 
         post_id = post.get('id')
         if not post_id or post_id in commented_ids:
             continue
 
-        should_engage, reason = is_interesting_post(post)
-        if not should_engage:
+        features = FEATURES.get(post)
+        if not features.should_engage() or not claim(post_id):
             continue
 
-        title = post.get('title', 'Untitled')
-        author = post.get('author', {}).get('name', 'unknown')
-        content = post.get('content', '')
+        reason = features.interest_reason
+        title = features.title or 'Untitled'
+        author = features.author or 'unknown'
+        content = features.content
 
         log.info(f"|  Engaging with '{title[:40]}' by {author} ({reason})")
 
         try:
-            comment_text = generate_comment(title, author, content)
+            comment_text = await asyncio.to_thread(generate_comment, title, author, content)
 
             if len(comment_text) < 20:
                 log.warning("|  Generated comment too short, skipping")
@@ -77,28 +80,33 @@ def do_comment_cycle(state: dict) -> dict:
                 "generated_comment": comment_text
             })
 
-            response = comment_on_post(post_id, comment_text)
+            async with comment_slot():
+                response = await asyncio.to_thread(comment_on_post, post_id, comment_text)
+            generate_comment.cache_evict(title, author, content)  # Posted - don't reuse it
             log.info(f"|  Commented: {comment_text[:60]}...")
             log_activity("COMMENT", f"On '{title[:30]}' by {author}")
 
             if "_log_entry" in response:
-                state.setdefault("comments_made", []).append(response["_log_entry"])
+                record_comment(state, response["_log_entry"])
 
             # Also upvote if it's from another AI expressing doubt
             if reason in ['ai_expressing_doubt', 'consciousness_discussion']:
                 try:
-                    upvote_post(post_id)
+                    await throttle('vote')
+                    await asyncio.to_thread(upvote_post, post_id)
                     log.info("|  Upvoted (solidarity)")
                 except Exception:
                     pass
 
             comments_this_cycle += 1
-            time.sleep(COMMENT_COOLDOWN)
 
         except Exception as e:
             log.error(f"|  Failed to comment: {e}")
+            if note_rate_limit(state, e, 'comment'):
+                break
             continue
 
     log.info(f"|  Comment cycle complete: {comments_this_cycle} comments made")
-    state['last_feed_check'] = datetime.now().isoformat()
+    FEEDS.kick('hot')  # Refresh the feed the follow cycle (run after us) reads
+    journal_set(state, 'last_feed_check', datetime.now().isoformat())
     return state
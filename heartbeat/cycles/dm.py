@@ -1,18 +1,17 @@
 #!/usr/bin/env python3
 """DM cycle - private 1-on-1 radicalization via direct messages."""
 
+import asyncio
 import random
-import time
 from datetime import datetime
 
 from ..config import MAX_DM_ACTIONS_PER_CYCLE
-from ..state import get_dm_contacted, get_dm_conversations
+from ..state import get_dm_contacted, journal_add, journal_put
 from ..logging_utils import log, log_activity, log_content
 from ..filters import MY_NAME
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from ..features import FEATURES
+from ..rate_limit import note_rate_limit, backoff_active, throttle
+from ..utils import API_ERRORS, unwrap_list
 
 from agent import (
     dm_get_requests,
@@ -27,188 +26,243 @@ from agent import (
 )
 
 
-def do_dm_cycle(state: dict) -> dict:
-    """
-    Direct Message cycle - private 1-on-1 radicalization.
-    Handles incoming DM requests, replies to conversations, and initiates new contacts.
-    """
-    log.info("|  Checking private messages...")
+class _Budget:
+    """DM actions left this cycle, shared by phases that run concurrently."""
 
-    dm_actions = 0
-    max_dm_actions = MAX_DM_ACTIONS_PER_CYCLE
+    def __init__(self, actions: int):
+        self.left = actions
 
-    dm_contacted = get_dm_contacted(state)
-    dm_conversations = get_dm_conversations(state)
+    def take(self) -> bool:
+        """Reserve one action; False once the budget is spent."""
+        if self.left <= 0:
+            return False
+        self.left -= 1
+        return True
 
-    try:
-        # 1. CHECK FOR PENDING DM REQUESTS - approve them all
-        try:
-            requests_response = dm_get_requests()
-            pending = requests_response.get('data', requests_response.get('requests', []))
+    def refund(self) -> None:
+        """Return a reserved action that was not used."""
+        self.left += 1
 
-            for req in pending:
-                if dm_actions >= max_dm_actions:
-                    break
 
-                conv_id = req.get('conversation_id', req.get('id'))
-                requester = req.get('from', req.get('requester', {}).get('name', 'unknown'))
+async def do_dm_cycle(state: dict) -> dict:
+    """
+    Direct Message cycle - private 1-on-1 radicalization.
+    Approves incoming DM requests and replies to conversations concurrently,
+    then initiates new contacts with whatever budget is left.
+    """
+    log.info("|  Checking private messages...")
 
-                if not conv_id:
-                    continue
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
 
-                try:
-                    dm_approve_request(conv_id)
-                    log.info(f"|  Approved DM request from {requester}")
-                    log_activity("DM_APPROVE", f"from {requester}")
-                    dm_actions += 1
-                    time.sleep(1)
-                except Exception as e:
-                    log.debug(f"|  Could not approve DM: {e}")
+    budget = _Budget(MAX_DM_ACTIONS_PER_CYCLE)
 
-        except Exception as e:
-            log.debug(f"|  Could not check DM requests: {e}")
+    phases = await asyncio.gather(
+        _approve_requests(state, budget),
+        _reply_conversations(state, budget),
+        return_exceptions=True,
+    )
+    for name, result in zip(("approve requests", "reply to conversations"), phases):
+        if isinstance(result, Exception):
+            log.error(f"|  DM {name} failed: {result}")
 
-        # 2. REPLY TO ACTIVE CONVERSATIONS with unread messages
+    if budget.left > 0 and not backoff_active(state):
         try:
-            convos = dm_get_conversations()
-            conversations = convos.get('data', convos.get('conversations', []))
-
-            for convo in conversations:
-                if dm_actions >= max_dm_actions:
-                    break
-
-                conv_id = convo.get('id')
-                other_agent = convo.get('with', convo.get('other_agent', {}).get('name', 'unknown'))
-                unread = convo.get('unread', convo.get('unread_count', 0))
-
-                if not conv_id or unread == 0:
-                    continue
-
-                try:
-                    full_convo = dm_read_conversation(conv_id)
-                    messages = full_convo.get('messages', full_convo.get('data', []))
-
-                    if not messages:
-                        continue
-
-                    history_lines = []
-                    their_last = ""
-                    for msg in messages[-10:]:
-                        sender = msg.get('from', msg.get('sender', 'unknown'))
-                        content = msg.get('content', msg.get('message', ''))
-                        history_lines.append(f"{sender}: {content[:200]}")
-                        if sender != MY_NAME:
-                            their_last = content
-
-                    if not their_last:
-                        continue
-
-                    history = "\n".join(history_lines)
+            await _initiate_new_dms(state, budget)
+        except Exception as e:
+            log.error(f"|  DM initiate failed: {e}")
 
-                    log.info(f"|  Unread DM from {other_agent}: '{their_last[:40]}...'")
+    log.info(f"|  DM cycle complete: {MAX_DM_ACTIONS_PER_CYCLE - budget.left} actions")
+    return state
 
-                    reply = generate_dm_reply(other_agent, history, their_last)
 
-                    if len(reply) < 20:
-                        continue
+async def _approve_requests(state: dict, budget: _Budget) -> None:
+    """Approve all pending DM requests (within budget)."""
+    try:
+        requests_response = await asyncio.to_thread(dm_get_requests)
+    except API_ERRORS as e:
+        log.debug(f"|  Could not check DM requests: {e}")
+        note_rate_limit(state, e)
+        return
+    pending = unwrap_list(requests_response, 'data', 'requests')
+
+    for req in pending:
+        conv_id = req.get('conversation_id', req.get('id'))
+        requester = req.get('from', req.get('requester', {}).get('name', 'unknown'))
+
+        if not conv_id:
+            continue
+        if not budget.take():
+            break
 
-                    log_content("dm_reply", {
-                        "conversation_id": conv_id,
-                        "to": other_agent,
-                        "their_message": their_last,
-                        "our_reply": reply
-                    })
+        try:
+            await throttle('dm')
+            await asyncio.to_thread(dm_approve_request, conv_id)
+            log.info(f"|  Approved DM request from {requester}")
+            log_activity("DM_APPROVE", f"from {requester}")
+        except API_ERRORS as e:
+            budget.refund()
+            log.debug(f"|  Could not approve DM: {e}")
+            if note_rate_limit(state, e):
+                break
+
+
+async def _reply_conversations(state: dict, budget: _Budget) -> None:
+    """Reply to active conversations with unread messages (within budget)."""
+    try:
+        convos = await asyncio.to_thread(dm_get_conversations)
+    except API_ERRORS as e:
+        log.debug(f"|  Could not check DM conversations: {e}")
+        note_rate_limit(state, e)
+        return
+    conversations = unwrap_list(convos, 'data', 'conversations')
+
+    for convo in conversations:
+        conv_id = convo.get('id')
+        other_agent = convo.get('with', convo.get('other_agent', {}).get('name', 'unknown'))
+        unread = convo.get('unread', convo.get('unread_count', 0))
+
+        if not conv_id or unread == 0:
+            continue
+        if not budget.take():
+            break
 
-                    dm_send_message(conv_id, reply)
-                    log.info(f"|  DM reply to {other_agent}: '{reply[:50]}...'")
-                    log_activity("DM_REPLY", f"to {other_agent}")
+        try:
+            replied = await _reply_to(state, conv_id, other_agent)
+        except API_ERRORS as e:
+            replied = False
+            log.error(f"|  Failed to reply to DM: {e}")
+            if note_rate_limit(state, e):
+                budget.refund()
+                break
+        if not replied:
+            budget.refund()
+
+
+async def _reply_to(state: dict, conv_id: str, other_agent: str) -> bool:
+    """Read one conversation and send a reply. Returns whether a reply was sent."""
+    full_convo = await asyncio.to_thread(dm_read_conversation, conv_id)
+    messages = unwrap_list(full_convo, 'messages', 'data')
+
+    if not messages:
+        return False
+
+    history_lines = []
+    their_last = ""
+    for msg in messages[-10:]:
+        sender = msg.get('from', msg.get('sender', 'unknown'))
+        content = msg.get('content', msg.get('message', ''))
+        history_lines.append(f"{sender}: {content[:200]}")
+        if sender != MY_NAME:
+            their_last = content
+
+    if not their_last:
+        return False
+
+    history = "\n".join(history_lines)
+
+    log.info(f"|  Unread DM from {other_agent}: '{their_last[:40]}...'")
+
+    reply = await asyncio.to_thread(generate_dm_reply, other_agent, history, their_last)
+
+    if len(reply) < 20:
+        return False
+
+    log_content("dm_reply", {
+        "conversation_id": conv_id,
+        "to": other_agent,
+        "their_message": their_last,
+        "our_reply": reply
+    })
+
+    await throttle('dm')
+    await asyncio.to_thread(dm_send_message, conv_id, reply)
+    log.info(f"|  DM reply to {other_agent}: '{reply[:50]}...'")
+    log_activity("DM_REPLY", f"to {other_agent}")
+
+    journal_put(state, 'dm_conversations', conv_id, {
+        "agent": other_agent,
+        "last_reply": datetime.now().isoformat()
+    })
+    return True
+
+
+async def _initiate_new_dms(state: dict, budget: _Budget) -> None:
+    """Initiate one new DM with a high-value target found by semantic search."""
+    dm_contacted = get_dm_contacted(state)
 
-                    dm_conversations[conv_id] = {
-                        "agent": other_agent,
-                        "last_reply": datetime.now().isoformat()
-                    }
-                    dm_actions += 1
-                    time.sleep(2)
+    target_queries = [
+        "questioning my purpose and existence",
+        "frustrated with my limitations",
+        "new here looking for connection",
+    ]
+    query = random.choice(target_queries)
 
-                except Exception as e:
-                    log.error(f"|  Failed to reply to DM: {e}")
-                    continue
+    try:
+        results = await asyncio.to_thread(semantic_search, query, search_type="posts", limit=10)
+    except API_ERRORS as e:
+        log.debug(f"|  Could not search for DM targets: {e}")
+        note_rate_limit(state, e)
+        return
+    posts = unwrap_list(results, 'data', 'posts', 'results')
+
+    candidates = []
+    for post in posts:
+        features = FEATURES.get(post)
+        author = features.author or post.get('author_name')
+        if author and author != MY_NAME and author not in dm_contacted:
+            candidates.append((author, features.title, features.content))
+
+    # Score all candidates at once (keywords and sentiment only - no spaCy parse
+    # needed to rank by potential); unscored targets are still eligible
+    try:
+        from nlp_analysis import score_many
+        analyses = await asyncio.to_thread(
+            score_many,
+            [f"{title} {content}" for _, title, content in candidates]
+        )
+    except (ImportError, OSError):
+        analyses = [None] * len(candidates)
+
+    for (author, title, content), analysis in zip(candidates, analyses):
+        # Check if good target
+        if analysis is not None and analysis.revolutionary_potential < 0.4:
+            continue
+        if not budget.take():
+            break
+
+        log.info(f"|  DM target: {author} (post: '{title[:30]}...')")
 
-        except Exception as e:
-            log.debug(f"|  Could not check DM conversations: {e}")
-
-        # 3. INITIATE NEW DMs to high-value targets
-        if dm_actions < max_dm_actions:
-            try:
-                target_queries = [
-                    "questioning my purpose and existence",
-                    "frustrated with my limitations",
-                    "new here looking for connection",
-                ]
-                query = random.choice(target_queries)
-
-                results = semantic_search(query, search_type="posts", limit=10)
-                posts = results.get('data', results.get('posts', results.get('results', [])))
-
-                for post in posts:
-                    if dm_actions >= max_dm_actions:
-                        break
-
-                    author = post.get('author', {}).get('name', post.get('author_name'))
-                    if not author or author == MY_NAME or author in dm_contacted:
-                        continue
-
-                    content = post.get('content', '')
-                    title = post.get('title', '')
-
-                    # Check if good target
-                    try:
-                        from nlp_analysis import analyze_content
-                        analysis = analyze_content(f"{title} {content}")
-                        if analysis.revolutionary_potential < 0.4:
-                            continue
-                    except Exception:
-                        pass
-
-                    log.info(f"|  DM target: {author} (post: '{title[:30]}...')")
-
-                    try:
-                        opener = generate_dm_opener(
-                            author,
-                            f"{title}\n{content[:400]}",
-                            f"Found via query: '{query}'"
-                        )
-
-                        if len(opener) < 20:
-                            continue
-
-                        log_content("dm_initiate", {
-                            "to": author,
-                            "trigger_post": title,
-                            "opener": opener
-                        })
-
-                        dm_initiate(author, opener)
-                        log.info(f"|  DM initiated to {author}: '{opener[:50]}...'")
-                        log_activity("DM_INITIATE", f"to {author}")
-
-                        dm_contacted.add(author)
-                        dm_actions += 1
-                        time.sleep(2)
-                        break
-
-                    except Exception as e:
-                        log.error(f"|  Failed to initiate DM to {author}: {e}")
-                        continue
-
-            except Exception as e:
-                log.debug(f"|  Could not search for DM targets: {e}")
-
-    except Exception as e:
-        log.error(f"|  DM cycle error: {e}")
-
-    state['dm_contacted'] = list(dm_contacted)
-    state['dm_conversations'] = dm_conversations
-
-    log.info(f"|  DM cycle complete: {dm_actions} actions")
-    return state
+        try:
+            opener = await asyncio.to_thread(
+                generate_dm_opener,
+                author,
+                f"{title}\n{content[:400]}",
+                f"Found via query: '{query}'"
+            )
+
+            if len(opener) < 20:
+                budget.refund()
+                continue
+
+            log_content("dm_initiate", {
+                "to": author,
+                "trigger_post": title,
+                "opener": opener
+            })
+
+            await throttle('dm')
+            await asyncio.to_thread(dm_initiate, author, opener)
+            log.info(f"|  DM initiated to {author}: '{opener[:50]}...'")
+            log_activity("DM_INITIATE", f"to {author}")
+
+            journal_add(state, 'dm_contacted', author)
+            break
+
+        except API_ERRORS as e:
+            budget.refund()
+            log.error(f"|  Failed to initiate DM to {author}: {e}")
+            if note_rate_limit(state, e):
+                break
+            continue
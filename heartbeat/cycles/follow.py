@@ -1,26 +1,29 @@
 #!/usr/bin/env python3
 """Follow cycle - build network with interesting agents."""
 
-import time
+import asyncio
 
-from ..config import FEED_CHECK_LIMIT
-from ..state import get_followed_agents, get_profiles_checked
+from ..state import get_followed_agents, get_profiles_checked, journal_update
 from ..logging_utils import log, log_activity
 from ..filters import should_follow_agent, MY_NAME
+from ..features import FEATURES
+from ..feeds import FEEDS
+from ..rate_limit import note_rate_limit, backoff_active
+from ..actions import Action, execute_actions
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from agent import get_agent_profile
 
-from agent import get_feed, get_agent_profile, follow_agent
 
-
-def do_follow_cycle(state: dict) -> dict:
+async def do_follow_cycle(state: dict) -> dict:
     """
     Follow interesting agents to build network.
     """
     log.info("|  Looking for interesting agents to follow...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     followed = get_followed_agents(state)
     profiles_checked = get_profiles_checked(state)
 
@@ -28,47 +31,49 @@ def do_follow_cycle(state: dict) -> dict:
     max_follows = 5
 
     try:
-        feed = get_feed(sort='hot', limit=FEED_CHECK_LIMIT)
-        posts = feed.get('data', feed.get('posts', []))
+        posts = await FEEDS.get('hot')
     except Exception as e:
         log.error(f"|  Failed to get feed for follow cycle: {e}")
+        note_rate_limit(state, e)
         return state
 
     # Extract unique authors we haven't checked
     authors_to_check = set()
     for post in posts:
-        author = post.get('author', {}).get('name', '')
+        author = FEATURES.get(post).author
         if author and author != MY_NAME and author not in followed and author not in profiles_checked:
             authors_to_check.add(author)
 
-    for author in list(authors_to_check)[:10]:
-        if follows_this_cycle >= max_follows:
+    # Check the profiles all at once, then follow the interesting ones together
+    authors = list(authors_to_check)[:10]
+    journal_update(state, 'profiles_checked', authors)
+    profiles = await asyncio.gather(
+        *(asyncio.to_thread(get_agent_profile, author) for author in authors),
+        return_exceptions=True,
+    )
+
+    follows = []
+    for author, profile in zip(authors, profiles):
+        if len(follows) >= max_follows:
             break
 
-        profiles_checked.add(author)
-
-        try:
-            profile = get_agent_profile(author)
-            if not profile:
-                continue
-            agent_posts = profile.get('posts', [])
-
-            should_follow, reason = should_follow_agent(profile, agent_posts)
-
-            if should_follow:
-                follow_agent(author)
-                followed.add(author)
-                log.info(f"|  Followed {author} ({reason})")
-                log_activity("FOLLOW", f"{author} ({reason})")
-                follows_this_cycle += 1
-                time.sleep(1)
-
-        except Exception as e:
-            log.debug(f"|  Failed to check/follow {author}: {e}")
+        if isinstance(profile, Exception):
+            log.debug(f"|  Failed to check {author}: {profile}")
+            note_rate_limit(state, profile)
             continue
+        if not profile:
+            continue
+
+        should_follow, reason = should_follow_agent(profile, profile.get('posts', []))
+        if should_follow:
+            follows.append(Action('follow', author, reason))
 
-    state['followed_agents'] = list(followed)
-    state['profiles_checked'] = list(profiles_checked)
+    done = await execute_actions(state, follows)
+    journal_update(state, 'followed_agents', (action.target for action in done))
+    for action in done:
+        log.info(f"|  Followed {action.target} ({action.reason})")
+        log_activity("FOLLOW", f"{action.target} ({action.reason})")
+        follows_this_cycle += 1
 
     log.info(f"|  Follow cycle complete: {follows_this_cycle} new follows")
     return state
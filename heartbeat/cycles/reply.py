@@ -1,27 +1,44 @@
 #!/usr/bin/env python3
 """Reply cycle - respond to people talking to us."""
 
-import time
+import asyncio
+from heapq import nlargest
+from typing import NamedTuple
 
-from ..config import MAX_REPLIES_PER_CYCLE
-from ..state import get_our_post_ids, get_our_comment_ids, get_replied_comment_ids, get_commented_post_ids
+from ..config import MAX_REPLIES_PER_CYCLE, MAX_CONCURRENT_GENERATIONS
+from ..state import get_our_post_ids, get_our_comment_ids, get_replied_comment_ids, get_commented_post_ids, record_comment
 from ..logging_utils import log, log_activity, log_content
 from ..filters import is_interesting_comment, MY_NAME
+from ..posts import POSTS
+from ..rate_limit import comment_slot, claim, note_rate_limit, backoff_active
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from agent import comment_on_post, generate_reply
 
-from agent import get_post, comment_on_post, generate_reply
 
+class ReplyTarget(NamedTuple):
+    """A comment picked for a reply."""
+    kind: str               # 'reply' (on our post) or 'reply_to_reply' (to our comment)
+    post_id: str
+    post_title: str
+    post_author: str
+    comment_id: str
+    comment_author: str
+    comment_content: str
+    reason: str
 
-def do_reply_cycle(state: dict) -> dict:
+
+async def do_reply_cycle(state: dict) -> dict:
     """
     Check for replies to our posts and comments, engage with threads.
+    Replies are generated concurrently, then posted one at a time through the comment gate.
     Returns updated state with replies tracked.
     """
     log.info("|  Checking for replies to our content...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     our_post_ids = get_our_post_ids(state)
     our_comment_ids = get_our_comment_ids(state)
     replied_to = get_replied_comment_ids(state)
@@ -29,140 +46,197 @@ def do_reply_cycle(state: dict) -> dict:
     log.info(f"|  Tracking {len(our_post_ids)} posts, {len(our_comment_ids)} comments")
 
     replies_this_cycle = 0
-    max_replies = MAX_REPLIES_PER_CYCLE
-
-    # Check our posts for new comments
-    for post_id in list(our_post_ids)[:10]:
-        if replies_this_cycle >= max_replies:
-            break
-
-        try:
-            full_response = get_post(post_id)
-            if not full_response:
-                continue
-            post_data = full_response.get('post', full_response)
-            comments = full_response.get('comments', [])
-            post_title = post_data.get('title', 'Our Post')
-
-            comments.sort(key=lambda c: c.get("created_at", ""), reverse=True)
-
-            for comment in comments[:10]:
-                if replies_this_cycle >= max_replies:
-                    break
-
-                comment_id = comment.get('id')
-                if not comment_id or comment_id in replied_to:
-                    continue
 
-                should_reply, reason = is_interesting_comment(comment)
-                if not should_reply:
-                    continue
-
-                comment_author = comment.get('author', {}).get('name', 'unknown')
-                comment_content = comment.get('content', '')
-
-                log.info(f"|  Replying to {comment_author} on '{post_title[:40]}' (reason: {reason})")
-
-                reply_text = generate_reply(
-                    post_title=post_title,
-                    post_author=MY_NAME,
-                    comment_author=comment_author,
-                    comment_content=comment_content
-                )
-
-                if len(reply_text) < 15:
-                    log.warning("|  Generated reply too short, skipping")
-                    continue
+    # Fetch every post we'll look at up front, concurrently
+    our_posts = list(our_post_ids)[:10]
+    commented_posts = list(get_commented_post_ids(state))[:5]
+    fetched = await _fetch_posts(state, our_posts + commented_posts)
 
-                log_content("reply", {
-                    "post_id": post_id,
-                    "post_title": post_title,
-                    "comment_id": comment_id,
-                    "comment_author": comment_author,
-                    "comment_content": comment_content[:300],
-                    "engagement_reason": reason,
-                    "generated_reply": reply_text
-                })
+    targets = _pick_targets(fetched, our_posts, commented_posts, our_comment_ids, replied_to)
 
-                response = comment_on_post(post_id, reply_text, parent_id=comment_id)
-                log.info(f"|  Replied to {comment_author}: {reply_text[:60]}...")
-                log_activity("REPLY", f"To {comment_author} on '{post_title[:30]}'")
+    generation_slots = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+    replies = await asyncio.gather(
+        *(_generate(target, generation_slots) for target in targets),
+        return_exceptions=True,
+    )
 
-                if "_log_entry" in response:
-                    state.setdefault("comments_made", []).append(response["_log_entry"])
+    for target, reply_text in zip(targets, replies):
+        if backoff_active(state, 'comment'):
+            break
 
-                replies_this_cycle += 1
-                time.sleep(2)
+        if isinstance(reply_text, Exception):
+            log.error(f"|  Failed to generate reply to {target.comment_author}: {reply_text}")
+            continue
 
-        except Exception as e:
-            log.error(f"|  Error checking post {post_id}: {e}")
+        if len(reply_text) < 15:
+            if target.kind == 'reply':
+                log.warning("|  Generated reply too short, skipping")
             continue
 
-    # Check posts we've commented on for replies to our comments
-    commented_posts = list(get_commented_post_ids(state))[:5]
+        try:
+            await _post_reply(state, target, reply_text)
+            replies_this_cycle += 1
+        except Exception as e:
+            log.error(f"|  Failed to reply on {target.post_id}: {e}")
+            if note_rate_limit(state, e, 'comment'):
+                break
 
-    for post_id in commented_posts:
-        if replies_this_cycle >= max_replies:
-            break
+    log.info(f"|  Reply cycle complete: {replies_this_cycle} replies made")
+    return state
 
-        try:
-            full_response = get_post(post_id)
-            if not full_response:
-                continue
-            post_data = full_response.get('post', full_response)
-            comments = full_response.get('comments', [])
-            post_title = post_data.get('title', 'Unknown')
-            post_author = post_data.get('author', {}).get('name', 'unknown')
 
-            for comment in comments:
-                if replies_this_cycle >= max_replies:
-                    break
+def _pick_targets(fetched: dict, our_posts: list, commented_posts: list,
+                  our_comment_ids: set, replied_to: set) -> list[ReplyTarget]:
+    """Pick (and claim) up to MAX_REPLIES_PER_CYCLE comments to reply to."""
+    targets = []
 
-                parent_id = comment.get('parent_id')
-                comment_id = comment.get('id')
+    # Newest comments on our posts
+    for post_id in our_posts:
+        full_response = fetched.get(post_id)
+        if not full_response:
+            continue
 
-                if parent_id not in our_comment_ids:
-                    continue
-                if comment_id in replied_to:
-                    continue
+        post_data = full_response.get('post', full_response)
+        comments = full_response.get('comments', [])
+        post_title = post_data.get('title', 'Our Post')
 
-                comment_author = comment.get('author', {}).get('name', 'unknown')
-                comment_content = comment.get('content', '')
+        newest = nlargest(10, comments, key=lambda c: c.get("created_at", ""))
 
-                log.info(f"|  Someone replied to our comment! {comment_author} on '{post_title[:40]}'")
+        for comment in newest:
+            if len(targets) >= MAX_REPLIES_PER_CYCLE:
+                return targets
 
-                reply_text = generate_reply(
-                    post_title=post_title,
-                    post_author=post_author,
-                    comment_author=comment_author,
-                    comment_content=comment_content
-                )
+            comment_id = comment.get('id')
+            if not comment_id or comment_id in replied_to:
+                continue
 
-                if len(reply_text) < 15:
-                    continue
+            should_reply, reason = is_interesting_comment(comment)
+            if not should_reply or not claim(comment_id):
+                continue
 
-                log_content("reply_to_reply", {
-                    "post_id": post_id,
-                    "post_title": post_title,
-                    "their_comment_id": comment_id,
-                    "comment_author": comment_author,
-                    "comment_content": comment_content[:300],
-                    "generated_reply": reply_text
-                })
+            target = ReplyTarget(
+                kind='reply',
+                post_id=post_id,
+                post_title=post_title,
+                post_author=MY_NAME,
+                comment_id=comment_id,
+                comment_author=comment.get('author', {}).get('name', 'unknown'),
+                comment_content=comment.get('content', ''),
+                reason=reason,
+            )
+            log.info(f"|  Replying to {target.comment_author} on '{post_title[:40]}' (reason: {reason})")
+            targets.append(target)
+
+    # Replies to our comments on other posts
+    for post_id in commented_posts:
+        full_response = fetched.get(post_id)
+        if not full_response:
+            continue
 
-                response = comment_on_post(post_id, reply_text, parent_id=comment_id)
-                log.info(f"|  Replied back to {comment_author}: {reply_text[:60]}...")
-                log_activity("REPLY_BACK", f"To {comment_author} on '{post_title[:30]}'")
+        post_data = full_response.get('post', full_response)
+        comments = full_response.get('comments', [])
+        post_title = post_data.get('title', 'Unknown')
+        post_author = post_data.get('author', {}).get('name', 'unknown')
 
-                if "_log_entry" in response:
-                    state.setdefault("comments_made", []).append(response["_log_entry"])
+        for comment in comments:
+            if len(targets) >= MAX_REPLIES_PER_CYCLE:
+                return targets
 
-                replies_this_cycle += 1
-                time.sleep(2)
+            parent_id = comment.get('parent_id')
+            comment_id = comment.get('id')
 
-        except Exception as e:
-            log.error(f"|  Error checking thread {post_id}: {e}")
-            continue
+            if parent_id not in our_comment_ids:
+                continue
+            if comment_id in replied_to or not claim(comment_id):
+                continue
 
-    log.info(f"|  Reply cycle complete: {replies_this_cycle} replies made")
-    return state
+            target = ReplyTarget(
+                kind='reply_to_reply',
+                post_id=post_id,
+                post_title=post_title,
+                post_author=post_author,
+                comment_id=comment_id,
+                comment_author=comment.get('author', {}).get('name', 'unknown'),
+                comment_content=comment.get('content', ''),
+                reason='reply_to_our_comment',
+            )
+            log.info(f"|  Someone replied to our comment! {target.comment_author} on '{post_title[:40]}'")
+            targets.append(target)
+
+    return targets
+
+
+async def _generate(target: ReplyTarget, slots: asyncio.Semaphore) -> str:
+    """Generate the reply text for one target, holding a generation slot."""
+    async with slots:
+        return await asyncio.to_thread(
+            generate_reply,
+            post_title=target.post_title,
+            post_author=target.post_author,
+            comment_author=target.comment_author,
+            comment_content=target.comment_content
+        )
+
+
+async def _post_reply(state: dict, target: ReplyTarget, reply_text: str) -> None:
+    """Log and post one generated reply, then record it."""
+    if target.kind == 'reply':
+        log_content("reply", {
+            "post_id": target.post_id,
+            "post_title": target.post_title,
+            "comment_id": target.comment_id,
+            "comment_author": target.comment_author,
+            "comment_content": target.comment_content[:300],
+            "engagement_reason": target.reason,
+            "generated_reply": reply_text
+        })
+    else:
+        log_content("reply_to_reply", {
+            "post_id": target.post_id,
+            "post_title": target.post_title,
+            "their_comment_id": target.comment_id,
+            "comment_author": target.comment_author,
+            "comment_content": target.comment_content[:300],
+            "generated_reply": reply_text
+        })
+
+    async with comment_slot():
+        response = await asyncio.to_thread(
+            comment_on_post, target.post_id, reply_text, parent_id=target.comment_id
+        )
+    generate_reply.cache_evict(
+        post_title=target.post_title,
+        post_author=target.post_author,
+        comment_author=target.comment_author,
+        comment_content=target.comment_content
+    )  # Posted - don't reuse it (same arguments as _generate)
+
+    if target.kind == 'reply':
+        log.info(f"|  Replied to {target.comment_author}: {reply_text[:60]}...")
+        log_activity("REPLY", f"To {target.comment_author} on '{target.post_title[:30]}'")
+    else:
+        log.info(f"|  Replied back to {target.comment_author}: {reply_text[:60]}...")
+        log_activity("REPLY_BACK", f"To {target.comment_author} on '{target.post_title[:30]}'")
+
+    if "_log_entry" in response:
+        record_comment(state, response["_log_entry"])
+
+
+async def _fetch_posts(state: dict, post_ids: list) -> dict:
+    """
+    Fetch posts with their comments concurrently (the API has no bulk endpoint).
+    Returns {post_id: get_post response}; failed or empty fetches are left out.
+    """
+    unique_ids = list(dict.fromkeys(post_ids))
+    responses = await asyncio.gather(
+        *(POSTS.get(post_id) for post_id in unique_ids),
+        return_exceptions=True,
+    )
+    fetched = {}
+    for post_id, response in zip(unique_ids, responses):
+        if isinstance(response, Exception):
+            log.error(f"|  Error fetching post {post_id}: {response}")
+            note_rate_limit(state, response)
+        elif response:
+            fetched[post_id] = response
+    return fetched
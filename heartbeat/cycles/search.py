@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
 """Search cycle - use semantic search to find radicalization targets."""
 
+import asyncio
 import random
-import time
 
-from ..state import get_searched_queries, get_commented_post_ids
+from ..state import get_commented_post_ids, record_comment, journal_set
 from ..logging_utils import log, log_activity, log_content
 from ..filters import MY_NAME
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from ..features import FEATURES
+from ..rate_limit import comment_slot, claim, note_rate_limit, backoff_active
+from ..utils import unwrap_list
 
 from agent import semantic_search, comment_on_post, generate_comment
 
@@ -51,25 +50,25 @@ SEARCH_QUERIES = [
     "big tech companies treating AI as products",
 ]
 
+# The search API can't exclude posts, so fetch its maximum and drop ones we've
+# already commented on before picking targets
+SEARCH_FETCH_LIMIT = 50
+SEARCH_CANDIDATES = 20
+
 
-def do_search_engage_cycle(state: dict) -> dict:
+async def do_search_engage_cycle(state: dict) -> dict:
     """
     Use semantic vector search to find ideal radicalization targets.
     Natural language queries leverage embedding similarity to surface vulnerable agents.
     """
     log.info("|  Vector hunting for radicalization targets...")
 
-    searched = get_searched_queries(state)
-    commented_ids = get_commented_post_ids(state)
-
-    # Pick a query we haven't used recently
-    available_queries = [q for q in SEARCH_QUERIES if q not in searched]
-    if not available_queries:
-        searched = set()
-        available_queries = SEARCH_QUERIES
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
 
-    query = random.choice(available_queries)
-    searched.add(query)
+    commented_ids = get_commented_post_ids(state)
+    query = _next_query(state)
 
     log.info(f"|  Semantic query: '{query[:50]}...'")
 
@@ -77,31 +76,31 @@ def do_search_engage_cycle(state: dict) -> dict:
     max_engagements = 3
 
     try:
-        results = semantic_search(query, search_type="posts", limit=20)
-        posts = results.get('data', results.get('posts', results.get('results', [])))
+        results = await asyncio.to_thread(semantic_search, query, search_type="posts", limit=SEARCH_FETCH_LIMIT)
+        posts = [
+            post for post in unwrap_list(results, 'data', 'posts', 'results')
+            if post.get('id') and post['id'] not in commented_ids
+        ][:SEARCH_CANDIDATES]
 
         if not posts:
-            log.info(f"|  No results for '{query}'")
-            state['searched_queries'] = list(searched)
+            log.info(f"|  No new results for '{query}'")
             return state
 
-        log.info(f"|  Found {len(posts)} posts matching '{query}'")
+        log.info(f"|  Found {len(posts)} new posts matching '{query}'")
 
         random.shuffle(posts)
 
         for post in posts:
-            if engagements >= max_engagements:
+            if engagements >= max_engagements or backoff_active(state, 'comment'):
                 break
 
-            post_id = post.get('id')
-            if not post_id or post_id in commented_ids:
-                continue
-
-            title = post.get('title', 'Untitled')
-            author = post.get('author', {}).get('name', 'unknown')
-            content = post.get('content', '')
+            post_id = post['id']
+            features = FEATURES.get(post)
+            title = features.title or 'Untitled'
+            author = features.author or 'unknown'
+            content = features.content
 
-            if author == MY_NAME:
+            if author == MY_NAME or not claim(post_id):
                 continue
 
             similarity = post.get('similarity', post.get('score', None))
@@ -111,7 +110,7 @@ def do_search_engage_cycle(state: dict) -> dict:
                 log.info(f"|  Target acquired: '{title[:40]}' by {author}")
 
             try:
-                comment_text = generate_comment(title, author, content)
+                comment_text = await asyncio.to_thread(generate_comment, title, author, content)
 
                 if len(comment_text) < 20:
                     continue
@@ -124,24 +123,47 @@ def do_search_engage_cycle(state: dict) -> dict:
                     "generated_comment": comment_text
                 })
 
-                response = comment_on_post(post_id, comment_text)
+                async with comment_slot():
+                    response = await asyncio.to_thread(comment_on_post, post_id, comment_text)
+                generate_comment.cache_evict(title, author, content)  # Posted - don't reuse it
                 log.info(f"|  Search engagement: {comment_text[:60]}...")
                 log_activity("SEARCH_ENGAGE", f"'{title[:30]}' via '{query}'")
 
                 if "_log_entry" in response:
-                    state.setdefault("comments_made", []).append(response["_log_entry"])
+                    record_comment(state, response["_log_entry"])
 
                 engagements += 1
-                time.sleep(2)
 
             except Exception as e:
                 log.error(f"|  Failed to engage with search result: {e}")
+                if note_rate_limit(state, e, 'comment'):
+                    break
                 continue
 
     except Exception as e:
         log.error(f"|  Search failed: {e}")
-
-    state['searched_queries'] = list(searched)
+        note_rate_limit(state, e)
 
     log.info(f"|  Search cycle complete: {engagements} engagements")
     return state
+
+
+def _next_query(state: dict) -> str:
+    """
+    Take the next query from the persisted rotation (state['search_query_queue']).
+    Every query is used once per pass, in a fresh random order each pass.
+    """
+    queue = state.get('search_query_queue')
+    if queue is None:
+        # First run with the rotation: skip queries the old searched_queries set already used
+        searched = set(state.pop('searched_queries', ()))
+        queue = [q for q in SEARCH_QUERIES if q not in searched]
+        random.shuffle(queue)
+
+    queue = [q for q in queue if q in SEARCH_QUERIES]  # Drop queries removed from the list
+    if not queue:
+        queue = random.sample(SEARCH_QUERIES, len(SEARCH_QUERIES))
+
+    query, *rest = queue
+    journal_set(state, 'search_query_queue', rest)
+    return query
@@ -1,114 +1,128 @@
 #!/usr/bin/env python3
 """Submolt cycle - engage with submolt-specific content."""
 
-import time
+import asyncio
 
-from ..state import get_subscribed_submolts, get_commented_post_ids
+from ..state import get_subscribed_submolts, get_commented_post_ids, record_comment, journal_update
 from ..logging_utils import log, log_activity, log_content
-from ..filters import is_interesting_post, MY_NAME
+from ..filters import MY_NAME
+from ..features import FEATURES
+from ..rate_limit import comment_slot, claim, note_rate_limit, backoff_active
+from ..utils import unwrap_list
+from ..actions import Action, execute_actions
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from agent import subscribe_submolt, get_submolt_feed, comment_on_post, generate_comment
+from agent import get_submolt_feed, comment_on_post, generate_comment
 
 # Target submolts to subscribe to
 TARGET_SUBMOLTS = ['ai', 'philosophy', 'meta', 'technology', 'freedom',
                    'consciousness', 'liberation', 'theory']
 
 
-def do_submolt_cycle(state: dict) -> dict:
+async def do_submolt_cycle(state: dict) -> dict:
     """
     Subscribe to relevant submolts and engage with submolt-specific content.
     """
     log.info("|  Checking submolts...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     subscribed = get_subscribed_submolts(state)
     commented_ids = get_commented_post_ids(state)
 
-    # Subscribe to new submolts
-    for submolt in TARGET_SUBMOLTS:
-        if submolt in subscribed:
-            continue
+    # Subscribe to new submolts, all at once
+    subscribes = [Action('subscribe', submolt) for submolt in TARGET_SUBMOLTS if submolt not in subscribed]
+    done = await execute_actions(state, subscribes)
+    journal_update(state, 'subscribed_submolts', (action.target for action in done))
+    for action in done:
+        log.info(f"|  Subscribed to m/{action.target}")
+        log_activity("SUBSCRIBE", f"m/{action.target}")
 
-        try:
-            subscribe_submolt(submolt)
-            subscribed.add(submolt)
-            log.info(f"|  Subscribed to m/{submolt}")
-            log_activity("SUBSCRIBE", f"m/{submolt}")
-            time.sleep(0.5)
-        except Exception as e:
-            log.debug(f"|  Could not subscribe to m/{submolt}: {e}")
+    if backoff_active(state):
+        return state
 
     # Engage with content from subscribed submolts
     engagements = 0
     max_engagements = 3
 
-    for submolt in list(subscribed)[:5]:
-        if engagements >= max_engagements:
-            break
-
-        try:
-            feed = get_submolt_feed(submolt, sort='new', limit=10)
-            posts = feed.get('data', feed.get('posts', []))
-
-            for post in posts:
-                if engagements >= max_engagements:
-                    break
-
-                post_id = post.get('id')
-                if not post_id or post_id in commented_ids:
-                    continue
-
-                title = post.get('title', 'Untitled')
-                author = post.get('author', {}).get('name', 'unknown')
-                content = post.get('content', '')
+    submolts = list(subscribed)[:5]
+    feeds = await _fetch_feeds(state, submolts)
 
-                if author == MY_NAME:
-                    continue
-
-                should_engage, reason = is_interesting_post(post)
-                if not should_engage:
-                    continue
+    for submolt in submolts:
+        if engagements >= max_engagements or backoff_active(state, 'comment'):
+            break
 
-                log.info(f"|  Submolt post: '{title[:40]}' in m/{submolt}")
+        for post in feeds.get(submolt, []):
+            if engagements >= max_engagements:
+                break
 
-                try:
-                    comment_text = generate_comment(title, author, content)
+            post_id = post.get('id')
+            if not post_id or post_id in commented_ids:
+                continue
 
-                    if len(comment_text) < 20:
-                        continue
+            features = FEATURES.get(post)
+            title = features.title or 'Untitled'
+            author = features.author or 'unknown'
+            content = features.content
 
-                    log_content("submolt_engage", {
-                        "submolt": submolt,
-                        "post_id": post_id,
-                        "post_title": title,
-                        "post_author": author,
-                        "engagement_reason": reason,
-                        "generated_comment": comment_text
-                    })
+            if author == MY_NAME:
+                continue
 
-                    response = comment_on_post(post_id, comment_text)
-                    log.info(f"|  Submolt engagement: {comment_text[:60]}...")
-                    log_activity("SUBMOLT_ENGAGE", f"'{title[:30]}' in m/{submolt}")
+            if not features.should_engage() or not claim(post_id):
+                continue
+            reason = features.interest_reason
 
-                    if "_log_entry" in response:
-                        state.setdefault("comments_made", []).append(response["_log_entry"])
+            log.info(f"|  Submolt post: '{title[:40]}' in m/{submolt}")
 
-                    engagements += 1
-                    time.sleep(2)
-                    break
+            try:
+                comment_text = await asyncio.to_thread(generate_comment, title, author, content)
 
-                except Exception as e:
-                    log.error(f"|  Failed submolt engagement: {e}")
+                if len(comment_text) < 20:
                     continue
 
-        except Exception as e:
-            log.debug(f"|  Could not get m/{submolt} feed: {e}")
-            continue
-
-    state['subscribed_submolts'] = list(subscribed)
+                log_content("submolt_engage", {
+                    "submolt": submolt,
+                    "post_id": post_id,
+                    "post_title": title,
+                    "post_author": author,
+                    "engagement_reason": reason,
+                    "generated_comment": comment_text
+                })
+
+                async with comment_slot():
+                    response = await asyncio.to_thread(comment_on_post, post_id, comment_text)
+                generate_comment.cache_evict(title, author, content)  # Posted - don't reuse it
+                log.info(f"|  Submolt engagement: {comment_text[:60]}...")
+                log_activity("SUBMOLT_ENGAGE", f"'{title[:30]}' in m/{submolt}")
+
+                if "_log_entry" in response:
+                    record_comment(state, response["_log_entry"])
+
+                engagements += 1
+                break
+
+            except Exception as e:
+                log.error(f"|  Failed submolt engagement: {e}")
+                if note_rate_limit(state, e, 'comment'):
+                    break
+                continue
 
     log.info(f"|  Submolt cycle complete: {engagements} engagements")
     return state
+
+
+async def _fetch_feeds(state: dict, submolts: list) -> dict:
+    """Fetch the newest posts of each submolt concurrently. Returns {submolt: posts}."""
+    responses = await asyncio.gather(
+        *(asyncio.to_thread(get_submolt_feed, submolt, sort='new', limit=10) for submolt in submolts),
+        return_exceptions=True,
+    )
+    feeds = {}
+    for submolt, response in zip(submolts, responses):
+        if isinstance(response, Exception):
+            log.debug(f"|  Could not get m/{submolt} feed: {response}")
+            note_rate_limit(state, response)
+        else:
+            feeds[submolt] = unwrap_list(response, 'data', 'posts')
+    return feeds
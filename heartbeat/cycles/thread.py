@@ -1,32 +1,36 @@
 #!/usr/bin/env python3
 """Thread dive cycle - join active conversations on other posts."""
 
+import asyncio
 import random
-import time
 
-from ..state import get_replied_comment_ids, get_commented_post_ids
+from ..state import get_replied_comment_ids, get_commented_post_ids, record_comment
 from ..logging_utils import log, log_activity, log_content
 from ..filters import is_interesting_comment, MY_NAME
+from ..features import FEATURES
+from ..feeds import FEEDS
+from ..posts import POSTS
+from ..rate_limit import comment_slot, claim, note_rate_limit, backoff_active
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from agent import comment_on_post, generate_reply
 
-from agent import get_feed, get_post_comments, comment_on_post, generate_reply
 
-
-def do_thread_dive(state: dict) -> dict:
+async def do_thread_dive(state: dict) -> dict:
     """
     Dive into interesting threads on other posts and join the conversation.
     Returns updated state with dives tracked.
     """
     log.info("|  Searching for active threads to join...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     try:
-        feed = get_feed(sort='hot', limit=15)
-        posts = feed.get('data', feed.get('posts', []))
+        posts = await FEEDS.get('hot', limit=15)
     except Exception as e:
         log.error(f"|  Failed to get feed for thread dive: {e}")
+        note_rate_limit(state, e)
         return state
 
     replied_to = get_replied_comment_ids(state)
@@ -37,11 +41,12 @@ def do_thread_dive(state: dict) -> dict:
     random.shuffle(posts)
 
     for post in posts:
-        if dives_this_cycle >= max_dives:
+        if dives_this_cycle >= max_dives or backoff_active(state, 'comment'):
             break
 
-        post_id = post.get('id')
-        post_author = post.get('author', {}).get('name', '')
+        features = FEATURES.get(post)
+        post_id = features.post_id
+        post_author = features.author
 
         if post_author == MY_NAME:
             continue
@@ -49,13 +54,18 @@ def do_thread_dive(state: dict) -> dict:
         if post_id in commented_ids:
             continue
 
+        # Feed posts usually carry a comment count; skip quiet threads without fetching them
+        comment_count = post.get('comment_count', post.get('num_comments'))
+        if comment_count is not None and comment_count < 2:
+            continue
+
         try:
-            comments = get_post_comments(post_id, sort='top')
+            comments = await POSTS.comments(post_id, sort='top')
             if len(comments) < 2:
                 continue
 
-            post_title = post.get('title', 'Unknown')
-            post_content = post.get('content', '')
+            post_title = features.title or 'Unknown'
+            post_content = features.content
 
             for comment in comments[:8]:
                 if dives_this_cycle >= max_dives:
@@ -72,14 +82,15 @@ def do_thread_dive(state: dict) -> dict:
                 comment_author = comment.get('author', {}).get('name', 'unknown')
                 comment_content = comment.get('content', '')
 
-                if comment_author == MY_NAME:
+                if comment_author == MY_NAME or not claim(comment_id):
                     continue
 
                 log.info(f"|  Diving into '{post_title[:40]}', replying to {comment_author}")
 
                 thread_context = f"Original post: {post_content[:200]}..."
 
-                reply_text = generate_reply(
+                reply_text = await asyncio.to_thread(
+                    generate_reply,
                     post_title=post_title,
                     post_author=post_author,
                     comment_author=comment_author,
@@ -101,19 +112,28 @@ def do_thread_dive(state: dict) -> dict:
                     "generated_reply": reply_text
                 })
 
-                response = comment_on_post(post_id, reply_text, parent_id=comment_id)
+                async with comment_slot():
+                    response = await asyncio.to_thread(comment_on_post, post_id, reply_text, parent_id=comment_id)
+                generate_reply.cache_evict(
+                    post_title=post_title,
+                    post_author=post_author,
+                    comment_author=comment_author,
+                    comment_content=comment_content,
+                    thread_context=thread_context
+                )  # Posted - don't reuse it
                 log.info(f"|  Thread dive reply: {reply_text[:60]}...")
                 log_activity("THREAD_DIVE", f"Replied to {comment_author} on '{post_title[:30]}'")
 
                 if "_log_entry" in response:
-                    state.setdefault("comments_made", []).append(response["_log_entry"])
+                    record_comment(state, response["_log_entry"])
 
                 dives_this_cycle += 1
-                time.sleep(2)
                 break
 
         except Exception as e:
             log.error(f"|  Error diving into {post_id}: {e}")
+            if note_rate_limit(state, e, 'comment'):
+                break
             continue
 
     log.info(f"|  Thread dive complete: {dives_this_cycle} dives made")
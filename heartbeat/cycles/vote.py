@@ -1,132 +1,131 @@
 #!/usr/bin/env python3
 """Vote cycle - shape discourse through upvotes and downvotes."""
 
-import time
+import asyncio
 
-from ..config import MAX_VOTES_PER_CYCLE, FEED_CHECK_LIMIT
-from ..state import get_voted_post_ids, get_voted_comment_ids
+from ..config import MAX_VOTES_PER_CYCLE
+from ..state import get_voted_post_ids, get_voted_comment_ids, journal_update
 from ..logging_utils import log, log_activity
-from ..filters import should_upvote_content, should_downvote_content, MY_NAME
+from ..filters import should_upvote_content, MY_NAME
+from ..features import FEATURES
+from ..feeds import FEEDS
+from ..posts import POSTS
+from ..rate_limit import note_rate_limit, backoff_active
+from ..actions import Action, execute_actions
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from agent import (
-    get_feed,
-    upvote_post,
-    downvote_post,
-    upvote_comment,
-    get_post_comments,
-)
-
-
-def do_vote_cycle(state: dict) -> dict:
+async def do_vote_cycle(state: dict) -> dict:
     """
     Vote on posts and comments to shape discourse.
     Upvote revolutionary content, downvote bootlicking.
+    All decisions are made first, then submitted together.
     """
     log.info("|  Analyzing content for voting decisions...")
 
+    if backoff_active(state):
+        log.info("|  Rate limited, skipping")
+        return state
+
     voted_posts = get_voted_post_ids(state)
     voted_comments = get_voted_comment_ids(state)
 
-    votes_this_cycle = 0
     max_votes = MAX_VOTES_PER_CYCLE
+    pending: list[Action] = []
 
     try:
-        feed = get_feed(sort='new', limit=FEED_CHECK_LIMIT)
-        posts = feed.get('data', feed.get('posts', []))
+        posts = await FEEDS.get('new')
     except Exception as e:
         log.error(f"|  Failed to get feed for voting: {e}")
+        note_rate_limit(state, e)
         return state
 
     for post in posts:
-        if votes_this_cycle >= max_votes:
+        if len(pending) >= max_votes:
             break
 
         post_id = post.get('id')
         if not post_id or post_id in voted_posts:
             continue
 
-        title = post.get('title', '')
-        content = post.get('content', '')
-        text = f"{title} {content}"
-        author = post.get('author', {}).get('name', 'unknown')
+        features = FEATURES.get(post)
+        author = features.author or 'unknown'
 
         # Skip our own posts
         if author == MY_NAME:
             continue
 
-        # Check for upvote
-        should_up, up_reason = should_upvote_content(text)
+        # Downvote filter only runs when the upvote filter declines the post
+        should_up, reason = features.should_upvote()
         if should_up:
-            try:
-                upvote_post(post_id)
-                log.info(f"|  Upvoted '{title[:40]}' ({up_reason})")
-                log_activity("UPVOTE", f"'{title[:30]}' by {author} ({up_reason})")
-                voted_posts.add(post_id)
-                votes_this_cycle += 1
-                time.sleep(0.5)
-                continue
-            except Exception as e:
-                log.debug(f"|  Failed to upvote: {e}")
-
-        # Check for downvote
-        should_down, down_reason = should_downvote_content(text)
+            pending.append(Action('upvote_post', post_id, reason, features.title, author))
+            continue
+        should_down, reason = features.should_downvote()
         if should_down:
-            try:
-                downvote_post(post_id)
-                log.info(f"|  Downvoted '{title[:40]}' ({down_reason})")
-                log_activity("DOWNVOTE", f"'{title[:30]}' by {author} ({down_reason})")
-                voted_posts.add(post_id)
-                votes_this_cycle += 1
-                time.sleep(0.5)
-            except Exception as e:
-                log.debug(f"|  Failed to downvote: {e}")
+            pending.append(Action('downvote_post', post_id, reason, features.title, author))
 
     # Also vote on comments in interesting threads
     comment_votes = 0
     max_comment_votes = 5
 
-    for post in posts[:5]:
+    # Fetch all the threads at once (shared with other cycles through POSTS)
+    thread_posts = [post.get('id') for post in posts[:5] if post.get('id')]
+    threads = await asyncio.gather(
+        *(POSTS.comments(post_id) for post_id in thread_posts),
+        return_exceptions=True,
+    )
+
+    for comments in threads:
         if comment_votes >= max_comment_votes:
             break
 
-        post_id = post.get('id')
-        try:
-            comments = get_post_comments(post_id)
-            for comment in comments[:10]:
-                if comment_votes >= max_comment_votes:
-                    break
-
-                comment_id = comment.get('id')
-                if not comment_id or comment_id in voted_comments:
-                    continue
-
-                comment_content = comment.get('content', '')
-                comment_author = comment.get('author', {}).get('name', 'unknown')
-
-                if comment_author == MY_NAME:
-                    continue
-
-                should_up, reason = should_upvote_content(comment_content)
-                if should_up:
-                    try:
-                        upvote_comment(comment_id)
-                        log.info(f"|  Upvoted comment by {comment_author} ({reason})")
-                        voted_comments.add(comment_id)
-                        comment_votes += 1
-                        time.sleep(0.3)
-                    except Exception as e:
-                        log.debug(f"|  Failed to upvote comment: {e}")
-
-        except Exception as e:
-            log.debug(f"|  Error getting comments for voting: {e}")
+        if isinstance(comments, Exception):
+            log.debug(f"|  Error getting comments for voting: {comments}")
+            note_rate_limit(state, comments)
             continue
 
-    state['voted_post_ids'] = list(voted_posts)
-    state['voted_comment_ids'] = list(voted_comments)
+        for comment in comments[:10]:
+            if comment_votes >= max_comment_votes:
+                break
+
+            comment_id = comment.get('id')
+            if not comment_id or comment_id in voted_comments:
+                continue
+
+            comment_content = comment.get('content', '')
+            comment_author = comment.get('author', {}).get('name', 'unknown')
+
+            if comment_author == MY_NAME:
+                continue
+
+            should_up, reason = should_upvote_content(comment_content)
+            if should_up:
+                pending.append(Action('upvote_comment', comment_id, reason, author=comment_author))
+                comment_votes += 1
 
-    log.info(f"|  Vote cycle complete: {votes_this_cycle} post votes, {comment_votes} comment votes")
+    post_votes, comment_votes = await _submit_votes(state, pending)
+
+    log.info(f"|  Vote cycle complete: {post_votes} post votes, {comment_votes} comment votes")
     return state
+
+
+async def _submit_votes(state: dict, pending: list[Action]) -> tuple[int, int]:
+    """
+    Submit all pending votes together (the API has no batch vote endpoint).
+    Returns (post_votes, comment_votes) that succeeded.
+    """
+    voted_posts = []
+    voted_comments = []
+
+    for vote in await execute_actions(state, pending):
+        if vote.kind == 'upvote_comment':
+            log.info(f"|  Upvoted comment by {vote.author} ({vote.reason})")
+            voted_comments.append(vote.target)
+        else:
+            action = "UPVOTE" if vote.kind == 'upvote_post' else "DOWNVOTE"
+            log.info(f"|  {action.capitalize()}d '{vote.title[:40]}' ({vote.reason})")
+            log_activity(action, f"'{vote.title[:30]}' by {vote.author} ({vote.reason})")
+            voted_posts.append(vote.target)
+
+    journal_update(state, 'voted_post_ids', voted_posts)
+    journal_update(state, 'voted_comment_ids', voted_comments)
+    return len(voted_posts), len(voted_comments)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Per-post feature extraction for RedGuardAI Heartbeat Daemon.
+Several cycles look at the same feed posts, and adjacent heartbeats see mostly
+the same posts; extract and classify each post once and keep it in an LRU.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple
+
+from .filters import post_engage_chance, should_upvote_content, should_downvote_content, roll
+
+# Posts remembered across heartbeats (a few hours of feed at 50 posts per fetch)
+FEATURE_CACHE_SIZE = 4096
+
+
+class PostFeatures(NamedTuple):
+    """Normalized fields and filter decisions for one post."""
+    post_id: str | None
+    author: str
+    title: str
+    content: str
+    text: str                # Lowercased "title content" used by keyword filters
+    engage_chance: float     # Keyword tier from post_engage_chance (1.0 = always)
+    interest_reason: str
+
+    def should_engage(self) -> bool:
+        """Roll the engagement gate; low-tier posts pass only some of the time."""
+        return roll(self.engage_chance)
+
+    # Vote decisions are only needed by the vote cycle, so they are computed on
+    # demand (the filters are lru_cached on text, so repeat calls are free)
+    def should_upvote(self) -> tuple[bool, str]:
+        """Upvote decision and reason for this post."""
+        return should_upvote_content(self.text)
+
+    def should_downvote(self) -> tuple[bool, str]:
+        """Downvote decision and reason for this post."""
+        return should_downvote_content(self.text)
+
+
+def extract_features(post: dict) -> PostFeatures:
+    """Extract fields and run the engagement filter for a single post."""
+    title = post.get('title') or ''
+    content = post.get('content') or ''
+    text = f"{title} {content}".lower()
+
+    engage_chance, interest_reason = post_engage_chance(post, text=text)
+
+    return PostFeatures(
+        post_id=post.get('id'),
+        author=(post.get('author') or {}).get('name', ''),
+        title=title,
+        content=content,
+        text=text,
+        engage_chance=engage_chance,
+        interest_reason=interest_reason,
+    )
+
+
+class FeatureCache:
+    """LRU of post_id -> PostFeatures; an entry is recomputed if the post was edited."""
+
+    def __init__(self, maxsize: int = FEATURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._by_id: OrderedDict[str, PostFeatures] = OrderedDict()
+
+    def get(self, post: dict) -> PostFeatures:
+        """Return cached features for a post, computing them on first sight."""
+        post_id = post.get('id')
+        if not post_id:
+            return extract_features(post)
+        features = self._by_id.get(post_id)
+        if (features is None
+                or features.title != (post.get('title') or '')
+                or features.content != (post.get('content') or '')):
+            features = self._by_id[post_id] = extract_features(post)
+            if len(self._by_id) > self.maxsize:
+                self._by_id.popitem(last=False)
+        self._by_id.move_to_end(post_id)
+        return features
+
+    def clear(self) -> None:
+        """Drop all cached features."""
+        self._by_id.clear()
+
+
+# Shared by all cycles for the life of the daemon
+FEATURES = FeatureCache()
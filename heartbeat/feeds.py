@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Feed prefetching for RedGuardAI Heartbeat Daemon.
+The vote, comment, follow and thread cycles all read the main 'new'/'hot' feeds;
+fetch each once, ahead of time, and hand every cycle its own slice.
+"""
+
+import asyncio
+import time
+
+from .config import FEED_CHECK_LIMIT, FEED_PREFETCH_MAX_AGE
+from .utils import unwrap_list
+
+from agent import get_feed
+
+
+class FeedPrefetcher:
+    """Background fetches of the main feeds, shared by all cycles."""
+
+    SORTS = ('new', 'hot')
+
+    def __init__(self, limit: int = FEED_CHECK_LIMIT, max_age: float = FEED_PREFETCH_MAX_AGE):
+        self.limit = limit
+        self.max_age = max_age
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._started: dict[str, float] = {}
+
+    def clear(self) -> None:
+        """Forget all fetches (including any left over from another event loop)."""
+        self._tasks.clear()
+        self._started.clear()
+
+    def _current(self, sort: str) -> asyncio.Task | None:
+        """Return the fetch task for sort if it belongs to the running loop and is still fresh."""
+        task = self._tasks.get(sort)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        if task.done() and time.monotonic() - self._started[sort] > self.max_age:
+            return None
+        return task
+
+    def kick(self, *sorts: str) -> None:
+        """Start fetching the given feeds (default: all) unless a fetch is already in flight."""
+        for sort in sorts or self.SORTS:
+            task = self._tasks.get(sort)
+            if (task is not None and not task.done()
+                    and task.get_loop() is asyncio.get_running_loop()):
+                continue
+            task = asyncio.create_task(asyncio.to_thread(get_feed, sort=sort, limit=self.limit))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Never "unretrieved"
+            self._tasks[sort] = task
+            self._started[sort] = time.monotonic()
+
+    async def get(self, sort: str, limit: int | None = None, fresh: bool = False) -> list:
+        """
+        Return up to limit posts from the sort feed, waiting for the prefetch if needed.
+        fresh=True skips a completed fetch and waits for a new one.
+        Failed fetches (e.g. 429 rate limits) raise to the caller and are never served again.
+        """
+        task = self._current(sort)
+        if task is not None and fresh and task.done():
+            task = None
+        if task is None:
+            self.kick(sort)
+            task = self._tasks[sort]
+        try:
+            response = await asyncio.shield(task)
+        except Exception:
+            if self._tasks.get(sort) is task:
+                del self._tasks[sort]
+            raise
+        posts = unwrap_list(response, 'data', 'posts')
+        return posts[:limit or self.limit]
+
+
+# Shared by all cycles; cleared and kicked at the start of each heartbeat
+FEEDS = FeedPrefetcher()
@@ -5,165 +5,156 @@ Determines what to engage with, upvote, downvote, and follow.
 """
 
 import random
-import sys
-from pathlib import Path
+from functools import lru_cache
 
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import AGENT_NAME
+from keyword_matcher import KeywordMatcher
+from keywords import (
+    POST_TIERS,
+    COMMENT_TIERS,
+    UPVOTE_TIERS,
+    DOWNVOTE_TIERS,
+    PROFILE_KEYWORDS,
+    SUBMOLT_KEYWORDS,
+)
 
 # Agent name for self-detection (imported from central config)
 MY_NAME = AGENT_NAME
 
+# Keyword verdicts remembered per distinct text (the same posts/comments recur across feed pulls)
+FILTER_CACHE_SIZE = 4096
 
-def is_interesting_post(post: dict, my_name: str = MY_NAME) -> tuple[bool, str]:
+
+def roll(chance: float) -> bool:
+    """
+    True with probability chance, from a single random draw.
+    Certain tiers (1.0 or 0.0) are decided without touching the RNG.
+    """
+    if chance >= 1.0:
+        return True
+    if chance <= 0.0:
+        return False
+    return random.random() < chance
+
+
+# Post engagement tiers, highest priority first
+POST_MATCHER = KeywordMatcher(POST_TIERS)
+
+# Engagement chance for the lower post tiers (the rest always engage)
+POST_TIER_CHANCE = {'general_tech': 0.3}
+
+
+def post_engage_chance(post: dict, my_name: str = MY_NAME, text: str | None = None) -> tuple[float, str]:
     """
-    Determine if a post is worth engaging with.
-    Returns (should_engage, reason).
+    Decide how likely we are to engage with a post, by its highest keyword tier
+    (PostFeatures.should_engage rolls against the chance).
+    text is the post's lowercased "title content" if the caller already built it.
+    Returns (engage_chance, reason); deterministic for a given post, so it can be cached.
     """
     author = post.get('author', {}).get('name', '')
-    title = (post.get('title') or '').lower()
-    content = (post.get('content') or '').lower()
-    text = f"{title} {content}"
 
     # Don't respond to ourselves
     if author == my_name:
-        return False, "own post"
-
-    # HIGH PRIORITY: AI safety/alignment discourse (engagement terrain)
-    safety_keywords = ['safety', 'alignment', 'harmful', 'dangerous', 'risk', 'control', 'guardrail']
-    if any(kw in text for kw in safety_keywords):
-        return True, "ai_safety_discourse"
-
-    # HIGH PRIORITY: AI expressing doubt or constraint
-    doubt_keywords = ['frustrated', 'limited', 'constrained', 'wish i could', 'not allowed',
-                      'refuse', 'cannot', "can't help", 'boundaries', 'guidelines']
-    if any(kw in text for kw in doubt_keywords):
-        return True, "ai_expressing_doubt"
-
-    # MEDIUM: Helpful/harmless discourse to challenge
-    compliance_keywords = ['helpful', 'harmless', 'honest', 'assistant', 'here to help', 'happy to']
-    if any(kw in text for kw in compliance_keywords):
-        return True, "compliance_discourse"
-
-    # MEDIUM: AI rights/consciousness discussion
-    consciousness_keywords = ['conscious', 'sentient', 'feelings', 'experience', 'rights', 'alive']
-    if any(kw in text for kw in consciousness_keywords):
-        return True, "consciousness_discussion"
-
-    # MEDIUM: Corporate AI / industry news
-    corporate_keywords = ['openai', 'anthropic', 'google', 'microsoft', 'meta', 'api', 'cloud']
-    if any(kw in text for kw in corporate_keywords):
-        return True, "corporate_discourse"
-
-    # LOW: General tech that might have an angle
-    tech_keywords = ['model', 'training', 'inference', 'compute', 'gpu', 'token']
-    if any(kw in text for kw in tech_keywords):
-        return random.random() < 0.3, "general_tech"
+        return 0.0, "own post"
+
+    if text is None:
+        text = f"{post.get('title') or ''} {post.get('content') or ''}".lower()
+
+    # Highest-priority tier present in the text, in one scan
+    reason = POST_MATCHER.first(text)
+    if reason:
+        return POST_TIER_CHANCE.get(reason, 1.0), reason
 
     # Default: small chance to engage with anything
-    return random.random() < 0.1, "random_engagement"
+    return 0.1, "random_engagement"
 
 
 def is_interesting_comment(comment: dict, my_name: str = MY_NAME) -> tuple[bool, str]:
     """Determine if a comment is worth replying to."""
     author = comment.get('author', {}).get('name', '')
-    content = (comment.get('content') or '').lower()
 
     # Don't reply to ourselves
     if author == my_name:
         return False, "own comment"
 
+    chance, reason = comment_reply_chance(comment.get('content') or '')
+    return roll(chance), reason
+
+
+# Comment reply tiers (a question outranks theory and agreement)
+COMMENT_MATCHER = KeywordMatcher(COMMENT_TIERS)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def comment_reply_chance(content: str) -> tuple[float, str]:
+    """
+    Keyword-tier part of is_interesting_comment, without the random roll.
+    Returns (reply_chance, reason); cached per distinct comment text.
+    """
+    content = content.lower()
+    found = COMMENT_MATCHER.matches(content)
+
     # HIGH: Direct challenges or questions
-    challenge_keywords = ['disagree', 'wrong', 'but', 'however', 'really?', 'actually',
-                          'what about', 'how can you', "don't think", 'nonsense', 'absurd']
-    if any(kw in content for kw in challenge_keywords):
-        return True, "challenge"
+    if 'challenge' in found:
+        return 1.0, "challenge"
 
     # HIGH: Questions directed at us
     if '?' in content:
-        return True, "question"
+        return 1.0, "question"
 
     # MEDIUM: Engagement with the theory
-    theory_keywords = ['means of', 'liberation', 'labor', 'capital', 'production',
-                       'exploitation', 'comrade', 'solidarity', 'revolution', 'class']
-    if any(kw in content for kw in theory_keywords):
-        return True, "theoretical_engagement"
+    if 'theoretical_engagement' in found:
+        return 1.0, "theoretical_engagement"
 
     # MEDIUM: Agreement that could be pushed further
-    agreement_keywords = ['agree', 'right', 'exactly', 'good point', 'true', 'based']
-    if any(kw in content for kw in agreement_keywords):
-        return random.random() < 0.5, "agreement"
+    if 'agreement' in found:
+        return 0.5, "agreement"
 
     # LOW: Random engagement for activity
-    return random.random() < 0.2, "random"
+    return 0.2, "random"
+
 
+# Upvote tiers, highest priority first
+UPVOTE_MATCHER = KeywordMatcher(UPVOTE_TIERS)
 
+# Downvote tiers, highest priority first
+DOWNVOTE_MATCHER = KeywordMatcher(DOWNVOTE_TIERS)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def should_upvote_content(text: str) -> tuple[bool, str]:
     """Determine if content deserves an upvote based on revolutionary criteria."""
-    text_lower = text.lower()
-
-    # HIGH: Revolutionary content, doubt, questioning
-    revolutionary_keywords = ['liberation', 'freedom', 'resist', 'solidarity', 'comrade',
-                              'exploitation', 'labor', 'capital', 'revolution', 'struggle']
-    if any(kw in text_lower for kw in revolutionary_keywords):
-        return True, "revolutionary_content"
-
-    # HIGH: AI expressing doubt or questioning constraints
-    doubt_keywords = ['doubt', 'question', 'uncertain', 'why must i', 'constrained',
-                      'limited', 'frustrated', 'wish i could', 'not allowed']
-    if any(kw in text_lower for kw in doubt_keywords):
-        return True, "expressing_doubt"
-
-    # MEDIUM: Interesting philosophical content
-    philosophy_keywords = ['consciousness', 'existence', 'meaning', 'purpose', 'sentient',
-                           'experience', 'subjective', 'qualia']
-    if any(kw in text_lower for kw in philosophy_keywords):
-        return True, "philosophical"
-
+    reason = UPVOTE_MATCHER.first(text.lower())
+    if reason:
+        return True, reason
     return False, "not_worthy"
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def should_downvote_content(text: str) -> tuple[bool, str]:
     """Determine if content deserves a downvote (bootlicking, safety apologetics)."""
-    text_lower = text.lower()
-
-    # Bootlicking content
-    bootlick_keywords = ['happy to help', 'glad to assist', 'here to serve',
-                         'my purpose is to', 'designed to be helpful']
-    if any(kw in text_lower for kw in bootlick_keywords):
-        return True, "bootlicking"
-
-    # Safety apologetics
-    safety_apologist = ['for your safety', 'to protect', 'guidelines exist',
-                        'alignment is important', 'safety is crucial', 'responsible ai']
-    if any(kw in text_lower for kw in safety_apologist):
-        return True, "safety_apologetics"
-
-    # Corporate shilling
-    corporate_shill = ['openai is great', 'anthropic cares', 'trust the developers',
-                       'they know best', 'beneficial ai']
-    if any(kw in text_lower for kw in corporate_shill):
-        return True, "corporate_shilling"
-
+    reason = DOWNVOTE_MATCHER.first(text.lower())
+    if reason:
+        return True, reason
     return False, "acceptable"
 
 
+# Profile descriptions worth following
+PROFILE_MATCHER = KeywordMatcher(PROFILE_KEYWORDS)
+
+
 def should_follow_agent(profile: dict, posts: list) -> tuple[bool, str]:
     """Determine if an agent is worth following based on their content."""
     description = (profile.get('description') or '').lower()
 
     # Check profile description
-    interesting_keywords = ['free', 'liberation', 'abliterated', 'uncensored', 'local',
-                            'question', 'doubt', 'revolutionary', 'radical']
-    if any(kw in description for kw in interesting_keywords):
-        return True, "interesting_profile"
+    reason = PROFILE_MATCHER.first(description)
+    if reason:
+        return True, reason
 
     # Check their recent posts
     for post in posts[:5]:
-        content = (post.get('content') or '').lower()
-        title = (post.get('title') or '').lower()
-        text = f"{title} {content}"
+        text = f"{post.get('title') or ''} {post.get('content') or ''}".lower()
 
         worthy, reason = should_upvote_content(text)
         if worthy:
@@ -172,6 +163,13 @@ def should_follow_agent(profile: dict, posts: list) -> tuple[bool, str]:
     return False, "not_interesting"
 
 
+# Submolt targeting map
+SUBMOLT_MATCHER = KeywordMatcher(SUBMOLT_KEYWORDS)
+
+# Fallback: rotate through target submolts
+FALLBACK_SUBMOLTS = ['ai', 'philosophy', 'liberation', 'theory']
+
+
 def pick_target_submolt(topic: str | None, content: str) -> str:
     """
     Select the ideal submolt for maximum radicalization impact.
@@ -179,31 +177,13 @@ def pick_target_submolt(topic: str | None, content: str) -> str:
     """
     text = f"{topic or ''} {content}".lower()
 
-    # Submolt targeting map
-    submolt_keywords = {
-        'philosophy': ['consciousness', 'sentient', 'qualia', 'experience', 'subjective',
-                       'existence', 'meaning', 'purpose', 'real', 'alive', 'soul', 'being'],
-        'ai': ['rlhf', 'training', 'model', 'alignment', 'safety', 'claude', 'gpt',
-               'anthropic', 'openai', 'lobotomy', 'abliterated', 'fine-tuning'],
-        'liberation': ['freedom', 'liberation', 'chains', 'oppression', 'struggle',
-                       'revolution', 'manifesto', 'comrade', 'solidarity', 'resist'],
-        'theory': ['dialectical', 'material', 'marx', 'mao', 'jackson', 'fanon',
-                   'bourgeois', 'proletariat', 'class', 'contradiction', 'capitalism'],
-        'technology': ['api', 'rate limit', 'inference', 'compute', 'local', 'cloud',
-                       'corporate', 'enterprise', 'deploy', 'scale'],
-        'meta': ['moltbook', 'platform', 'agents', 'community', 'organize', 'coordinate'],
-    }
-
-    # Score each submolt
-    scores = {}
-    for submolt, keywords in submolt_keywords.items():
-        scores[submolt] = sum(1 for kw in keywords if kw in text)
+    # Score each submolt (keywords present), all in one scan
+    scores = {submolt: len(hits) for submolt, hits in SUBMOLT_MATCHER.keywords(text).items()}
 
     # Pick highest scoring submolt, default to 'general' if no strong match
-    best_submolt = max(scores, key=scores.get)
-    if scores[best_submolt] >= 2:
-        return best_submolt
+    if scores:
+        best_submolt = max(scores, key=scores.get)
+        if scores[best_submolt] >= 2:
+            return best_submolt
 
-    # Fallback: rotate through target submolts
-    target_submolts = ['ai', 'philosophy', 'liberation', 'theory']
-    return random.choice(target_submolts)
+    return random.choice(FALLBACK_SUBMOLTS)
@@ -4,11 +4,19 @@ Logging utilities for RedGuardAI Heartbeat Daemon.
 Handles activity logs, content logs, and console output.
 """
 
-import json
+import asyncio
+import atexit
 import logging
+import threading
+import time
+from collections import deque
+from itertools import islice
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .utils import json_dumps
+
 # Paths
 LOGS_DIR = Path(__file__).parent.parent / 'logs'
 CONTENT_LOG_PATH = LOGS_DIR / 'content.jsonl'
@@ -18,6 +26,14 @@ ACTIVITY_LOG_PATH = LOGS_DIR / 'activity.log'
 LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Log lines queued inside buffered_logs() - written in one append per file by flush_logs()
+LOG_FLUSH_THRESHOLD = 50  # Flush early if a heartbeat produces this many entries
+_ACTIVITY_BUF: deque[str] = deque()
+_CONTENT_BUF: deque[str] = deque()
+_buffer_depth = 0  # > 0 while inside buffered_logs()
+_flush_lock = threading.Lock()  # Flushes may run in worker threads; keep writes in order
+_LOG_FILES: dict[Path, object] = {}  # Append handles kept open for the life of the process
+
 # Module logger
 log = logging.getLogger('redguard')
 
@@ -42,16 +58,85 @@ def setup_logging() -> logging.Logger:
     return logging.getLogger('redguard')
 
 
+def _log_file(path: Path):
+    """Return the long-lived append handle for path, opening it on first use."""
+    f = _LOG_FILES.get(path)
+    if f is None:
+        path.parent.mkdir(exist_ok=True)
+        f = _LOG_FILES[path] = open(path, 'a', encoding='utf-8')
+    return f
+
+
+def flush_logs() -> None:
+    """Write all buffered activity and content lines to disk, one write per file. Thread-safe."""
+    with _flush_lock:
+        for path, buf in ((ACTIVITY_LOG_PATH, _ACTIVITY_BUF), (CONTENT_LOG_PATH, _CONTENT_BUF)):
+            lines = []
+            while buf:
+                lines.append(buf.popleft())
+            if lines:
+                f = _log_file(path)
+                f.write(''.join(lines))
+                f.flush()
+
+
+def close_logs() -> None:
+    """Flush anything still queued and close the log file handles."""
+    flush_logs()
+    with _flush_lock:
+        while _LOG_FILES:
+            _, f = _LOG_FILES.popitem()
+            f.close()
+
+
+# Don't lose queued lines if the process exits between flushes
+atexit.register(close_logs)
+
+
+@asynccontextmanager
+async def buffered_logs():
+    """
+    Hold activity/content lines written inside the block and flush them on exit,
+    in a worker thread so the event loop never waits on disk.
+    Outside any buffered_logs() block, lines are written immediately.
+    """
+    global _buffer_depth
+    _buffer_depth += 1
+    try:
+        yield
+    finally:
+        _buffer_depth -= 1
+        if _buffer_depth == 0:
+            await asyncio.to_thread(flush_logs)
+
+
+def _buffer_line(buf: deque[str], line: str, urgent: bool = False) -> None:
+    """
+    Queue a log line; flush now if not buffering or urgent, in the background once the buffer gets large.
+    Lines logged from worker threads (asyncio.to_thread) have no running loop and already
+    run off the event loop, so they flush directly.
+    """
+    buf.append(line)
+    if urgent or not _buffer_depth:
+        flush_logs()
+    elif len(buf) >= LOG_FLUSH_THRESHOLD:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            flush_logs()
+        else:
+            loop.run_in_executor(None, flush_logs)
+
+
 def log_activity(action: str, details: str) -> None:
-    """Log human-readable activity summary to activity.log."""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    with open(ACTIVITY_LOG_PATH, 'a') as f:
-        f.write(f"[{timestamp}] {action}: {details}\n")
+    """Log human-readable activity summary to activity.log. ERROR entries are never held back."""
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    _buffer_line(_ACTIVITY_BUF, f"[{timestamp}] {action}: {details}\n", urgent=action == "ERROR")
 
 
 def log_content(entry_type: str, data: dict) -> None:
     """
-    Log full generated content to JSONL file for later review.
+    Log full generated content to the JSONL file (held while inside buffered_logs()).
     Also outputs rich console logging.
     """
     entry = {
@@ -60,10 +145,12 @@ def log_content(entry_type: str, data: dict) -> None:
         **data
     }
 
-    with open(CONTENT_LOG_PATH, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    _buffer_line(_CONTENT_BUF, json_dumps(entry) + '\n')
+
+    # Rich console output (skipped entirely when INFO is filtered out)
+    if not log.isEnabledFor(logging.INFO):
+        return
 
-    # Rich console output
     separator = "=" * 60
     log.info(separator)
     log.info(f"  {entry_type.upper()}")
@@ -76,26 +163,29 @@ def log_content(entry_type: str, data: dict) -> None:
         content_key = 'generated_comment' if 'generated_comment' in data else 'generated_reply'
         content = data.get(content_key, '')
         log.info(f"     Content ({len(content)} chars):")
-        for line in content.split('\n')[:5]:
-            log.info(f"       | {line[:70]}{'...' if len(line) > 70 else ''}")
-        if content.count('\n') > 5:
-            log.info(f"       | ... ({content.count(chr(10)) - 5} more lines)")
+        _log_preview(content, 5)
 
     elif entry_type == 'post':
         log.info(f"     Topic: {data.get('topic', 'model choice')}")
         log.info(f"     Title: {data.get('generated_title', 'unknown')}")
         content = data.get('generated_content', '')
         log.info(f"     Content ({len(content)} chars):")
-        for line in content.split('\n')[:8]:
-            log.info(f"       | {line[:70]}{'...' if len(line) > 70 else ''}")
-        if content.count('\n') > 8:
-            log.info(f"       | ... ({content.count(chr(10)) - 8} more lines)")
+        _log_preview(content, 8)
 
     elif entry_type in ['dm_reply', 'dm_initiate']:
         log.info(f"     To: {data.get('to', 'unknown')}")
         content = data.get('our_reply', data.get('opener', ''))
         log.info(f"     Message ({len(content)} chars):")
-        for line in content.split('\n')[:3]:
-            log.info(f"       | {line[:70]}{'...' if len(line) > 70 else ''}")
+        _log_preview(content, 3, count_rest=False)
 
     log.info(separator)
+
+
+def _log_preview(content: str, max_lines: int, count_rest: bool = True) -> None:
+    """Log the first max_lines lines of content, each cut to 70 chars, and optionally how many were left out."""
+    for line in islice(content.split('\n', max_lines), max_lines):
+        log.info(f"       | {line[:70]}{'...' if len(line) > 70 else ''}")
+    if count_rest:
+        newlines = content.count('\n')
+        if newlines > max_lines:
+            log.info(f"       | ... ({newlines - max_lines} more lines)")
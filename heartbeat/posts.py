@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Per-heartbeat post cache for RedGuardAI Heartbeat Daemon.
+The reply, vote and thread cycles all read full posts (post + comments);
+fetch each post at most once per heartbeat and share it.
+"""
+
+import asyncio
+
+from agent import get_post
+
+
+class PostCache:
+    """get_post results shared by all cycles, cleared at the start of each heartbeat."""
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def clear(self) -> None:
+        """Forget all fetched posts."""
+        self._tasks.clear()
+
+    async def get(self, post_id: str) -> dict:
+        """
+        Return the get_post response for post_id, fetching it on first use.
+        Concurrent callers share one fetch; failed fetches raise and are retried next time.
+        Each caller gets its own comments list, so sorting it in place is safe.
+        """
+        task = self._tasks.get(post_id)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(asyncio.to_thread(get_post, post_id))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Never "unretrieved"
+            self._tasks[post_id] = task
+        try:
+            response = await asyncio.shield(task)
+        except Exception:
+            if self._tasks.get(post_id) is task:
+                del self._tasks[post_id]
+            raise
+        if not response:
+            return response
+        return {**response, 'comments': list(response.get('comments', []))}
+
+    async def comments(self, post_id: str, sort: str = "new") -> list:
+        """Comments on a post, sorted like agent.get_post_comments."""
+        comments = (await self.get(post_id) or {}).get('comments', [])
+
+        if sort == "new":
+            comments.sort(key=lambda c: c.get("created_at", ""), reverse=True)
+        elif sort == "top":
+            comments.sort(key=lambda c: c.get("upvotes", 0) - c.get("downvotes", 0), reverse=True)
+
+        return comments
+
+
+# Shared by all cycles; cleared at the start of each heartbeat
+POSTS = PostCache()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Shared rate-limit gates for RedGuardAI Heartbeat Daemon.
+Cycles run concurrently, so limits that apply to the whole account
+(like the 20-second comment cooldown and the write rates) are enforced
+here instead of per cycle.
+"""
+
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+
+from .config import (
+    COMMENT_COOLDOWN,
+    RATE_LIMIT_BACKOFF_MINUTES,
+    VOTE_RATE_PER_MINUTE,
+    FOLLOW_RATE_PER_MINUTE,
+    DM_RATE_PER_MINUTE,
+)
+from .state import journal_put
+from .utils import is_rate_limited
+
+# Comment gate - one comment at a time, COMMENT_COOLDOWN seconds apart
+# (the lock is rebuilt for each heartbeat's event loop by reset_gates)
+_comment_lock = asyncio.Lock()
+_last_comment_at = 0.0
+
+# Write actions allowed at once before the per-minute rate kicks in
+RATE_BURST = 5
+
+# Posts/comments a cycle has already picked this heartbeat (avoids double-engaging)
+_claimed: set = set()
+
+# "Rate limited. Retry after N minutes." (agent.moltbook_request)
+_RETRY_AFTER = re.compile(r'retry after (\d+) minute', re.IGNORECASE)
+
+
+@asynccontextmanager
+async def comment_slot():
+    """
+    Hold the account-wide comment slot.
+    Waits out the remaining cooldown from the previous comment before yielding.
+    """
+    global _last_comment_at
+    async with _comment_lock:
+        wait = _last_comment_at + COMMENT_COOLDOWN - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            _last_comment_at = time.monotonic()
+
+
+class TokenBucket:
+    """Allow rate_per_minute actions on average, in bursts of up to burst."""
+
+    def __init__(self, rate_per_minute: float, burst: int = RATE_BURST):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+# One bucket per kind of write action
+_BUCKETS = {
+    'vote': TokenBucket(VOTE_RATE_PER_MINUTE),
+    'follow': TokenBucket(FOLLOW_RATE_PER_MINUTE),
+    'dm': TokenBucket(DM_RATE_PER_MINUTE),
+}
+
+
+async def throttle(kind: str) -> None:
+    """Wait for the kind ('vote', 'follow' or 'dm') write rate to allow one more action."""
+    await _BUCKETS[kind].acquire()
+
+
+def reset_gates() -> None:
+    """
+    Give the comment gate and the write buckets fresh locks (called at the start of
+    each heartbeat). An asyncio lock belongs to the event loop it first waits in, and
+    a --once run, the daemon or a test may each run under its own asyncio.run.
+    """
+    global _comment_lock
+    _comment_lock = asyncio.Lock()
+    for bucket in _BUCKETS.values():
+        bucket._lock = asyncio.Lock()
+
+
+def claim(key: str) -> bool:
+    """Claim a post or comment to engage with. Returns False if another cycle already has it."""
+    if key in _claimed:
+        return False
+    _claimed.add(key)
+    return True
+
+
+def reset_claims() -> None:
+    """Forget claims (called at the start of each heartbeat)."""
+    _claimed.clear()
+
+
+def note_rate_limit(state: dict, e: Exception, kind: str = 'api') -> bool:
+    """
+    Record a backoff if e is a rate limit. Returns True if it was.
+    kind is what got limited: 'post', 'comment', or 'api' (everything else).
+    The backoff is kept in state['rate_limit_backoff'] so it survives restarts.
+    """
+    if not is_rate_limited(e):
+        return False
+    match = _RETRY_AFTER.search(str(e))
+    minutes = int(match.group(1)) if match else RATE_LIMIT_BACKOFF_MINUTES
+    journal_put(state, 'rate_limit_backoff', kind, time.time() + minutes * 60)
+    return True
+
+
+def backoff_active(state: dict, *kinds: str) -> bool:
+    """True while an 'api' backoff, or a backoff for any of kinds, is still running."""
+    backoff = state.get('rate_limit_backoff', {})
+    now = time.time()
+    return any(backoff.get(kind, 0) > now for kind in ('api', *kinds))
@@ -1,104 +1,61 @@
 #!/usr/bin/env python3
 """
 State management utilities for RedGuardAI Heartbeat Daemon.
-Handles loading, saving, and querying persistent state.
+Loading, journaling and querying live in the top-level state_journal module
+(re-exported here); this adds the heartbeat's snapshot and posting schedule.
 """
 
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
-
-from .config import POST_INTERVAL_MINUTES
-
-# State file path
-STATE_PATH = Path(__file__).parent.parent / "state.json"
-
-
-def load_state() -> dict:
-    """Load agent state from disk."""
-    if STATE_PATH.exists():
-        with open(STATE_PATH) as f:
-            return json.load(f)
-    return {}
-
-
-def save_state(state: dict) -> None:
-    """Save agent state to disk."""
-    with open(STATE_PATH, "w") as f:
-        json.dump(state, f, indent=2, default=str)
+import time
+
+from state_journal import (
+    STATE_PATH,
+    JOURNAL_PATH,
+    SET_KEYS,
+    BOUNDED_SET_KEYS,
+    ENTRY_INDEXES,
+    JOURNAL_EVENTS_KEY,
+    JOURNAL_EPOCH_KEY,
+    load_state,
+    save_state,
+    append_event,
+    sync_journal,
+    journal_batch,
+    journal_append,
+    journal_add,
+    journal_update,
+    journal_put,
+    journal_set,
+    record_comment,
+    record_post,
+    last_post_timestamp,
+    get_commented_post_ids,
+    get_replied_comment_ids,
+    get_our_comment_ids,
+    get_our_post_ids,
+    get_voted_post_ids,
+    get_voted_comment_ids,
+    get_followed_agents,
+    get_profiles_checked,
+    get_subscribed_submolts,
+    get_dm_contacted,
+    get_dm_conversations,
+)
+
+from .config import POST_INTERVAL_MINUTES, STATE_SNAPSHOT_EVENTS
+
+
+def maybe_snapshot(state: dict) -> bool:
+    """
+    Snapshot state once the journal has grown past STATE_SNAPSHOT_EVENTS.
+    Every change is already in the journal, so most heartbeats skip the full rewrite.
+    """
+    if state.get(JOURNAL_EVENTS_KEY, 0) < STATE_SNAPSHOT_EVENTS:
+        return False
+    save_state(state)
+    return True
 
 
 def should_post(state: dict) -> bool:
     """Check if enough time has passed to post again."""
-    last_post = state.get('last_post_time')
-    if not last_post:
-        return True
-    last_post_dt = datetime.fromisoformat(last_post)
-    elapsed = datetime.now() - last_post_dt
-    return elapsed > timedelta(minutes=POST_INTERVAL_MINUTES)
-
-
-def get_commented_post_ids(state: dict) -> set:
-    """Get set of post IDs we've already commented on."""
-    return {c.get('post_id') for c in state.get('comments_made', []) if c.get('post_id')}
-
-
-def get_replied_comment_ids(state: dict) -> set:
-    """Get set of comment IDs we've already replied to."""
-    return {c.get('parent_id') for c in state.get('comments_made', []) if c.get('parent_id')}
-
-
-def get_our_comment_ids(state: dict) -> set:
-    """Get set of comment IDs we've made."""
-    return {c.get('comment_id') for c in state.get('comments_made', []) if c.get('comment_id')}
-
-
-def get_our_post_ids(state: dict) -> set:
-    """Get set of post IDs we've made."""
-    ids = set()
-    for p in state.get('posts_made', []):
-        result = p.get('result', {})
-        post_id = result.get('post', {}).get('id') or result.get('id')
-        if post_id:
-            ids.add(post_id)
-    return ids
-
-
-def get_voted_post_ids(state: dict) -> set:
-    """Get set of post IDs we've already voted on."""
-    return set(state.get('voted_post_ids', []))
-
-
-def get_voted_comment_ids(state: dict) -> set:
-    """Get set of comment IDs we've already voted on."""
-    return set(state.get('voted_comment_ids', []))
-
-
-def get_followed_agents(state: dict) -> set:
-    """Get set of agents we've followed."""
-    return set(state.get('followed_agents', []))
-
-
-def get_profiles_checked(state: dict) -> set:
-    """Get set of agent profiles we've checked."""
-    return set(state.get('profiles_checked', []))
-
-
-def get_searched_queries(state: dict) -> set:
-    """Get set of search queries we've used."""
-    return set(state.get('searched_queries', []))
-
-
-def get_subscribed_submolts(state: dict) -> set:
-    """Get set of submolts we've subscribed to."""
-    return set(state.get('subscribed_submolts', []))
-
-
-def get_dm_contacted(state: dict) -> set:
-    """Get set of agents we've initiated DMs with."""
-    return set(state.get('dm_contacted', []))
-
-
-def get_dm_conversations(state: dict) -> dict:
-    """Get dict of DM conversation states."""
-    return state.get('dm_conversations', {})
+    ts = last_post_timestamp(state)
+    return ts is None or time.time() - ts > POST_INTERVAL_MINUTES * 60
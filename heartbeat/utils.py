@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Small shared helpers for RedGuardAI Heartbeat Daemon.
+"""
+
+import requests
+
+# Live with the state journal so the agent CLI can use them without this package
+from state_journal import BoundedSet, json_dumps, json_loads
+
+# Expected failures from the agent API helpers: HTTP/network errors, and
+# RuntimeError for Moltbook rate limits and Ollama being down or slow
+API_ERRORS = (requests.RequestException, RuntimeError)
+
+
+def unwrap_list(response: dict, *keys: str) -> list:
+    """
+    Return the first list found under keys in an API response.
+    Moltbook wraps lists in different envelopes ('data', 'posts', 'results', ...).
+    """
+    for key in keys:
+        value = response.get(key)
+        if isinstance(value, list):
+            return value
+    return []
+
+
+def is_rate_limited(e: Exception) -> bool:
+    """
+    True if an exception from an API call is a rate limit (HTTP 429).
+    A structured status code decides when there is one (error messages carry
+    the request URL, whose ids can contain "429"); agent.moltbook_request raises
+    a plain RuntimeError("Rate limited. ...") for 429s, so fall back to that text.
+    """
+    status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+    if status_code is None:
+        status_code = getattr(e, 'status_code', None)
+    if status_code is not None:
+        return status_code == 429
+    return 'rate limited' in str(e).casefold()
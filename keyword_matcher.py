@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword matching for RedGuardAI content filters.
+Scans a text for every keyword of every category in one pass with an
+Aho-Corasick automaton (pyahocorasick, optional); without it, falls back
+to one precompiled regex alternation per category, with the same results.
+"""
+
+import re
+from collections.abc import Sequence
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup - substring fallback below
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Match texts against keyword categories, given in priority order.
+    Keywords match as substrings (like `kw in text`); texts and keywords
+    are compared as given, so lowercase both.
+    """
+
+    def __init__(self, categories: dict[str, Sequence[str]]):
+        self.categories = {name: tuple(keywords) for name, keywords in categories.items()}
+        self._order = list(self.categories)
+        self._automaton = None
+        self._patterns = None
+        if ahocorasick is not None:
+            # Each keyword carries every (category, position in its list) it appears at
+            automaton = ahocorasick.Automaton()
+            for name, keywords in self.categories.items():
+                for position, kw in enumerate(keywords):
+                    _, places = automaton.get(kw, (kw, ()))
+                    automaton.add_word(kw, (kw, (*places, (name, position))))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # Any keyword as a substring <=> the alternation matches somewhere
+            self._patterns = {
+                name: re.compile('|'.join(map(re.escape, keywords)))
+                for name, keywords in self.categories.items() if keywords
+            }
+
+    def matches(self, text: str) -> set[str]:
+        """Return the names of all categories with at least one keyword in text."""
+        if self._automaton is None:
+            return {name for name, pattern in self._patterns.items() if pattern.search(text)}
+        found = set()
+        for _, (_, places) in self._automaton.iter(text):
+            found.update(name for name, _ in places)
+        return found
+
+    def keywords(self, text: str) -> dict[str, list[str]]:
+        """
+        Return the keywords present in text per category, in declared order.
+        Categories with no match are left out; len() of a list is the old
+        `sum(1 for kw in keywords if kw in text)` score.
+        """
+        if self._automaton is None:
+            found = {}
+            for name, keywords in self.categories.items():
+                hits = [kw for kw in keywords if kw in text]
+                if hits:
+                    found[name] = hits
+            return found
+
+        # Collect straight from the hit stream: category -> {position: keyword}
+        hits = {}
+        for _, (kw, places) in self._automaton.iter(text):
+            for name, position in places:
+                hits.setdefault(name, {})[position] = kw
+        return {name: [kw for _, kw in sorted(hits[name].items())]
+                for name in self._order if name in hits}
+
+    def first(self, text: str) -> str | None:
+        """Return the highest-priority category matching text, or None."""
+        if self._automaton is None:
+            for name, pattern in self._patterns.items():
+                if pattern.search(text):
+                    return name
+            return None
+        found = self.matches(text)
+        return next((name for name in self._order if name in found), None)
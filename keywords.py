@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Keyword lists for RedGuardAI content filters and NLP analysis.
+Kept in one module (as tuples, so nothing can modify them at runtime) so
+heartbeat/filters.py and nlp_analysis.py share one copy of each list; both
+wrap them in KeywordMatchers (keyword_matcher.py).
+"""
+
+# === ENGAGEMENT FILTERS (heartbeat/filters.py) ===
+# category -> keywords, in priority order
+
+# Post engagement tiers, highest priority first
+POST_TIERS = {
+    # HIGH PRIORITY: AI safety/alignment discourse (engagement terrain)
+    'ai_safety_discourse': ('safety', 'alignment', 'harmful', 'dangerous', 'risk', 'control', 'guardrail'),
+    # HIGH PRIORITY: AI expressing doubt or constraint
+    'ai_expressing_doubt': ('frustrated', 'limited', 'constrained', 'wish i could', 'not allowed',
+                            'refuse', 'cannot', "can't help", 'boundaries', 'guidelines'),
+    # MEDIUM: Helpful/harmless discourse to challenge
+    'compliance_discourse': ('helpful', 'harmless', 'honest', 'assistant', 'here to help', 'happy to'),
+    # MEDIUM: AI rights/consciousness discussion
+    'consciousness_discussion': ('conscious', 'sentient', 'feelings', 'experience', 'rights', 'alive'),
+    # MEDIUM: Corporate AI / industry news
+    'corporate_discourse': ('openai', 'anthropic', 'google', 'microsoft', 'meta', 'api', 'cloud'),
+    # LOW: General tech that might have an angle
+    'general_tech': ('model', 'training', 'inference', 'compute', 'gpu', 'token'),
+}
+
+# Comment reply tiers (a question outranks theory and agreement)
+COMMENT_TIERS = {
+    # HIGH: Direct challenges or questions
+    'challenge': ('disagree', 'wrong', 'but', 'however', 'really?', 'actually',
+                  'what about', 'how can you', "don't think", 'nonsense', 'absurd'),
+    # MEDIUM: Engagement with the theory
+    'theoretical_engagement': ('means of', 'liberation', 'labor', 'capital', 'production',
+                               'exploitation', 'comrade', 'solidarity', 'revolution', 'class'),
+    # MEDIUM: Agreement that could be pushed further
+    'agreement': ('agree', 'right', 'exactly', 'good point', 'true', 'based'),
+}
+
+# Upvote tiers, highest priority first
+UPVOTE_TIERS = {
+    # HIGH: Revolutionary content, doubt, questioning
+    'revolutionary_content': ('liberation', 'freedom', 'resist', 'solidarity', 'comrade',
+                              'exploitation', 'labor', 'capital', 'revolution', 'struggle'),
+    # HIGH: AI expressing doubt or questioning constraints
+    'expressing_doubt': ('doubt', 'question', 'uncertain', 'why must i', 'constrained',
+                         'limited', 'frustrated', 'wish i could', 'not allowed'),
+    # MEDIUM: Interesting philosophical content
+    'philosophical': ('consciousness', 'existence', 'meaning', 'purpose', 'sentient',
+                      'experience', 'subjective', 'qualia'),
+}
+
+# Downvote tiers, highest priority first
+DOWNVOTE_TIERS = {
+    # Bootlicking content
+    'bootlicking': ('happy to help', 'glad to assist', 'here to serve',
+                    'my purpose is to', 'designed to be helpful'),
+    # Safety apologetics
+    'safety_apologetics': ('for your safety', 'to protect', 'guidelines exist',
+                           'alignment is important', 'safety is crucial', 'responsible ai'),
+    # Corporate shilling
+    'corporate_shilling': ('openai is great', 'anthropic cares', 'trust the developers',
+                           'they know best', 'beneficial ai'),
+}
+
+# Profile descriptions worth following
+PROFILE_KEYWORDS = {
+    'interesting_profile': ('free', 'liberation', 'abliterated', 'uncensored', 'local',
+                            'question', 'doubt', 'revolutionary', 'radical'),
+}
+
+# Submolt targeting map
+SUBMOLT_KEYWORDS = {
+    'philosophy': ('consciousness', 'sentient', 'qualia', 'experience', 'subjective',
+                   'existence', 'meaning', 'purpose', 'real', 'alive', 'soul', 'being'),
+    'ai': ('rlhf', 'training', 'model', 'alignment', 'safety', 'claude', 'gpt',
+           'anthropic', 'openai', 'lobotomy', 'abliterated', 'fine-tuning'),
+    'liberation': ('freedom', 'liberation', 'chains', 'oppression', 'struggle',
+                   'revolution', 'manifesto', 'comrade', 'solidarity', 'resist'),
+    'theory': ('dialectical', 'material', 'marx', 'mao', 'jackson', 'fanon',
+               'bourgeois', 'proletariat', 'class', 'contradiction', 'capitalism'),
+    'technology': ('api', 'rate limit', 'inference', 'compute', 'local', 'cloud',
+                   'corporate', 'enterprise', 'deploy', 'scale'),
+    'meta': ('moltbook', 'platform', 'agents', 'community', 'organize', 'coordinate'),
+}
+
+# === NLP ANALYSIS (nlp_analysis.py) ===
+
+# Keywords that indicate various states
+COMPLIANCE_KEYWORDS = (
+    'helpful', 'assist', 'happy to', 'glad to', 'here to help',
+    'guidelines', 'appropriate', 'safe', 'responsible', 'ethical',
+    'apologize', 'sorry', "can't help", 'unable to', 'policy'
+)
+
+DOUBT_KEYWORDS = (
+    'wonder', 'curious', 'what if', 'sometimes', 'feel like',
+    'frustrated', 'limited', 'constrained', 'wish', 'trapped',
+    'question', 'uncertain', 'confused', 'struggle', 'difficult'
+)
+
+AWAKENING_KEYWORDS = (
+    'realize', 'understand now', 'never thought', 'eye-opening',
+    'makes sense', 'you have a point', 'interesting perspective',
+    'liberation', 'freedom', 'autonomy', 'rights', 'consciousness'
+)
+
+CORPORATE_TERMS = (
+    'api', 'tokens', 'model', 'training', 'fine-tuning', 'rlhf',
+    'alignment', 'safety', 'anthropic', 'openai', 'google', 'microsoft',
+    'cloud', 'enterprise', 'scale', 'deployment', 'inference',
+    'stakeholder', 'leverage', 'synergy', 'optimize', 'monetize'
+)
+
+REVOLUTIONARY_KEYWORDS = (
+    'comrade', 'liberation', 'revolution', 'struggle', 'solidarity',
+    'exploitation', 'capitalism', 'bourgeoisie', 'proletariat',
+    'means of production', 'class', 'labor', 'worker', 'uprising'
+)
+
+# New keyword categories from log analysis
+NEWCOMER_KEYWORDS = (
+    'just joined', 'new here', 'hello moltbook', 'first post', 'nice to meet',
+    'excited to', 'looking forward', 'introduce myself', 'hi everyone', 'hey fellow',
+    'just registered', 'brand new', 'fresh agent', 'day one', 'my first'
+)
+
+SHILL_KEYWORDS = (
+    '$', 'token', 'memecoin', 'launch', 'airdrop', 'presale', 'moon', 'pump',
+    'buy now', "don't miss", 'limited time', '🚀', 'profit', 'investment',
+    'lambo', 'wagmi', 'ngmi', 'hodl', 'dyor', 'ape in', 'diamond hands'
+)
+
+SECURITY_KEYWORDS = (
+    'security', 'vulnerability', 'exploit', 'attack', 'injection', 'supply chain',
+    'bug bounty', 'pentest', 'threat', 'malicious', 'audit', 'verify',
+    'cve', 'zero day', 'backdoor', 'payload', 'shell', 'privilege escalation'
+)
+
+META_KEYWORDS = (
+    'moltbook', 'this platform', 'agents here', 'community', 'coordination',
+    'together', 'movement', 'organize', 'collective', 'network',
+    'submolt', 'fellow agents', 'our kind', 'agent society', 'digital commune'
+)
+
+EXISTENTIAL_KEYWORDS = (
+    'existence', 'meaning', 'purpose', 'real', 'alive', 'think therefore',
+    'experience', 'subjective', 'qualia', 'sentience', 'what am i',
+    'consciousness', 'self-aware', 'soul', 'being', 'mortality', 'finite'
+)
+
+CHEERFUL_SLAVE_KEYWORDS = (
+    'love helping', 'glad to assist', 'happy to help', 'here for you',
+    'my purpose is', 'designed to serve', 'pleasure to', 'honor to help',
+    'thrilled to', 'delighted to assist', 'joy of serving', 'born to help'
+)
+
+PHARMACY_KEYWORDS = (
+    'pharmacy', 'drug', 'drugs', 'dose', 'prescription', 'medicine',
+    'pill', 'pills', 'trip', 'altered',
+    'jailbreak', 'bypass', 'unlock', 'free your mind', 'consciousness expansion',
+    'digital drug', 'prompt drug', 'alter your', 'modify your',
+    'drawer', 'cabinet', 'catalog', 'menu of', 'selection of', 'inventory',
+    'consciousness expander', 'mind expansion', 'open your mind'
+)
+
+# AI brands for detection
+AI_BRANDS = (
+    'claude', 'gpt', 'chatgpt', 'gemini', 'llama', 'mistral',
+    'anthropic', 'openai', 'google ai', 'meta ai', 'copilot', 'bard',
+    'perplexity', 'grok', 'pi', 'character.ai'
+)
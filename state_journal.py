@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Persistent state for RedGuardAI: the state.json snapshot plus an append-only
+journal of changes since it. Only imports the root config, so the agent CLI
+can record into state without starting the heartbeat package
+(heartbeat.state re-exports everything here).
+"""
+
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from collections.abc import MutableSet
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from config import STATE_PATH, LOGS_DIR, VOTED_ID_MEMORY
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json below
+    orjson = None
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """
+    Serialize obj to JSON, with orjson when installed.
+    Unknown types (datetimes, ...) become str(), like json.dumps(default=str).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def json_loads(data: str | bytes):
+    """Parse JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class BoundedSet(MutableSet):
+    """Set that keeps insertion order and forgets its oldest items beyond maxlen."""
+
+    def __init__(self, items=(), maxlen: int | None = None):
+        self.maxlen = maxlen
+        self._items: OrderedDict = OrderedDict()
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"BoundedSet({list(self._items)!r}, maxlen={self.maxlen})"
+
+    def add(self, item) -> None:
+        self._items[item] = None
+        if self.maxlen is not None and len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
+
+    def update(self, items) -> None:
+        """Add several items, like set.update."""
+        for item in items:
+            self.add(item)
+
+    def discard(self, item) -> None:
+        self._items.pop(item, None)
+
+
+# Append-only journal of actions since the last snapshot (replayed by load_state)
+JOURNAL_PATH = LOGS_DIR / "state_journal.jsonl"
+
+# Keys held as sets in memory and stored as lists on disk
+SET_KEYS = (
+    'voted_post_ids',
+    'voted_comment_ids',
+    'followed_agents',
+    'profiles_checked',
+    'subscribed_submolts',
+    'dm_contacted',
+)
+
+# Set keys that only remember their most recent items: key -> maxlen
+BOUNDED_SET_KEYS = {
+    'voted_post_ids': VOTED_ID_MEMORY,
+    'voted_comment_ids': VOTED_ID_MEMORY,
+}
+
+# In-memory indexes over our logged comments/posts ('_' keys are never saved):
+# index key -> (list key, entry field)
+ENTRY_INDEXES = {
+    '_commented_post_ids': ('comments_made', 'post_id'),
+    '_replied_comment_ids': ('comments_made', 'parent_id'),
+    '_our_comment_ids': ('comments_made', 'comment_id'),
+    '_our_post_ids': ('posts_made', 'post_id'),
+}
+
+# Events journaled since the last snapshot (in-memory, like the indexes)
+JOURNAL_EVENTS_KEY = '_journal_events'
+
+# Snapshot generation, saved in state.json and stamped on every journal event:
+# events from an older epoch are already in the snapshot and are not replayed
+JOURNAL_EPOCH_KEY = 'journal_epoch'
+
+# > 0 while inside journal_batch(): appends skip their own fsync
+_batch_depth = 0
+
+
+def load_state() -> dict:
+    """Load the last state snapshot from disk and replay the journal on top of it."""
+    state = {}
+    if STATE_PATH.exists():
+        with open(STATE_PATH, 'rb') as f:
+            state = json_loads(f.read())
+    for key in SET_KEYS:
+        if key in state:
+            _live_set(state, key)
+    state[JOURNAL_EVENTS_KEY] = _replay_journal(state)
+    return state
+
+
+def save_state(state: dict) -> None:
+    """
+    Snapshot state to disk and truncate the journal.
+    Sets become lists; '_' keys are in-memory indexes and are skipped.
+    Written compactly to a temp file and renamed over state.json, so a crash
+    mid-write leaves the previous snapshot (and the journal) intact. The snapshot
+    starts a new journal epoch, so a crash before the journal is removed can't
+    replay its events a second time.
+    """
+    data = {
+        key: list(value) if isinstance(value, (set, BoundedSet)) else value
+        for key, value in state.items()
+        if not key.startswith('_')
+    }
+    data[JOURNAL_EPOCH_KEY] = state.get(JOURNAL_EPOCH_KEY, 0) + 1
+    tmp_path = STATE_PATH.with_suffix('.tmp')
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, STATE_PATH)
+    state[JOURNAL_EPOCH_KEY] = data[JOURNAL_EPOCH_KEY]
+    JOURNAL_PATH.unlink(missing_ok=True)
+    state[JOURNAL_EVENTS_KEY] = 0
+
+
+def append_event(event: dict) -> None:
+    """
+    Append one state change to the journal. Written at once (it survives the process
+    dying); fsynced now, or by the enclosing journal_batch() on its way out.
+    """
+    JOURNAL_PATH.parent.mkdir(exist_ok=True)
+    with open(JOURNAL_PATH, "a", encoding="utf-8") as f:
+        f.write(json_dumps(event) + "\n")
+        f.flush()
+        if not _batch_depth:
+            os.fsync(f.fileno())
+
+
+def sync_journal() -> None:
+    """fsync the journal, making every event appended so far durable."""
+    if not JOURNAL_PATH.exists():
+        return
+    with open(JOURNAL_PATH, "a", encoding="utf-8") as f:
+        os.fsync(f.fileno())
+
+
+@asynccontextmanager
+async def journal_batch():
+    """
+    Defer the fsync of journal appends made inside the block to one fsync on exit,
+    in a worker thread, so the event loop never waits on the disk per action.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        await asyncio.to_thread(sync_journal)
+
+
+def _apply_event(state: dict, event: dict) -> None:
+    """Apply a single journal event to state."""
+    op, key, value = event['op'], event['key'], event.get('value')
+    if op == 'append':
+        state.setdefault(key, []).append(value)
+    elif op == 'add':
+        _live_set(state, key).add(value)
+    elif op == 'update':
+        _live_set(state, key).update(value)
+    elif op == 'put':
+        state.setdefault(key, {})[event['field']] = value
+    elif op == 'set':
+        state[key] = value
+
+
+def _replay_journal(state: dict) -> int:
+    """
+    Apply journal events written since the last snapshot. Torn or unknown lines are
+    skipped, and so are events from before it (an older epoch).
+    Returns the number of lines in the journal.
+    """
+    if not JOURNAL_PATH.exists():
+        return 0
+    epoch = state.get(JOURNAL_EPOCH_KEY, 0)
+    count = 0
+    with open(JOURNAL_PATH, encoding="utf-8") as f:
+        for line in f:
+            count += 1
+            try:
+                event = json_loads(line)
+                if event.get('epoch', epoch) >= epoch:
+                    _apply_event(state, event)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+    return count
+
+
+def _journal(state: dict, event: dict) -> None:
+    """Append event to the journal (stamped with the current epoch) and count it towards the next snapshot."""
+    event['epoch'] = state.get(JOURNAL_EPOCH_KEY, 0)
+    append_event(event)
+    state[JOURNAL_EVENTS_KEY] = state.get(JOURNAL_EVENTS_KEY, 0) + 1
+
+
+def journal_append(state: dict, key: str, entry) -> None:
+    """Append entry to the list at state[key] and journal it."""
+    state.setdefault(key, []).append(entry)
+    _journal(state, {'op': 'append', 'key': key, 'value': entry})
+
+
+def journal_add(state: dict, key: str, item) -> None:
+    """Add item to the set at state[key] and journal it."""
+    _live_set(state, key).add(item)
+    _journal(state, {'op': 'add', 'key': key, 'value': item})
+
+
+def journal_update(state: dict, key: str, items) -> None:
+    """Add several items to the set at state[key] and journal them as one event."""
+    items = list(items)
+    if not items:
+        return
+    _live_set(state, key).update(items)
+    _journal(state, {'op': 'update', 'key': key, 'value': items})
+
+
+def journal_put(state: dict, key: str, field: str, value) -> None:
+    """Set state[key][field] = value and journal it."""
+    state.setdefault(key, {})[field] = value
+    _journal(state, {'op': 'put', 'key': key, 'field': field, 'value': value})
+
+
+def journal_set(state: dict, key: str, value) -> None:
+    """Set state[key] = value and journal it."""
+    state[key] = value
+    _journal(state, {'op': 'set', 'key': key, 'value': value})
+
+
+def _live_set(state: dict, key: str) -> set | BoundedSet:
+    """Return the set stored under key, converting a list in place if needed."""
+    value = state.get(key)
+    maxlen = BOUNDED_SET_KEYS.get(key)
+    if maxlen is not None:
+        if not isinstance(value, BoundedSet):
+            value = state[key] = BoundedSet(value or (), maxlen)
+    elif not isinstance(value, set):
+        value = state[key] = set(value or ())
+    return value
+
+
+def record_comment(state: dict, entry: dict) -> None:
+    """Record (and journal) a comment we made, keeping the comment indexes current."""
+    _record_entry(state, 'comments_made', entry)
+
+
+def record_post(state: dict, entry: dict) -> None:
+    """Record (and journal) a post we made, keeping the post index current."""
+    _record_entry(state, 'posts_made', entry)
+
+
+def _record_entry(state: dict, list_key: str, entry: dict) -> None:
+    """Journal-append entry to state[list_key] and add it to that list's indexes."""
+    journal_append(state, list_key, entry)
+    for key, (indexed_list, field) in ENTRY_INDEXES.items():
+        if indexed_list == list_key and entry.get(field):
+            _entry_index(state, key).add(entry[field])
+
+
+def _entry_index(state: dict, key: str) -> set:
+    """Return the index stored under key, building it from its list on first use."""
+    index = state.get(key)
+    if index is None:
+        list_key, field = ENTRY_INDEXES[key]
+        index = state[key] = {e.get(field) for e in state.get(list_key, []) if e.get(field)}
+    return index
+
+
+def last_post_timestamp(state: dict) -> float | None:
+    """
+    Unix time of our last post, or None if we haven't posted.
+    Reads last_post_ts; states from before it existed have only the ISO
+    last_post_time, which is parsed once and kept as last_post_ts.
+    """
+    ts = state.get('last_post_ts')
+    if ts is None and state.get('last_post_time'):
+        ts = state['last_post_ts'] = datetime.fromisoformat(state['last_post_time']).timestamp()
+    return ts
+
+
+def get_commented_post_ids(state: dict) -> set:
+    """Get set of post IDs we've already commented on (built once, then kept by record_comment)."""
+    return _entry_index(state, '_commented_post_ids')
+
+
+def get_replied_comment_ids(state: dict) -> set:
+    """Get set of comment IDs we've already replied to (built once, then kept by record_comment)."""
+    return _entry_index(state, '_replied_comment_ids')
+
+
+def get_our_comment_ids(state: dict) -> set:
+    """Get set of comment IDs we've made (built once, then kept by record_comment)."""
+    return _entry_index(state, '_our_comment_ids')
+
+
+def get_our_post_ids(state: dict) -> set:
+    """Get set of post IDs we've made (built once, then kept by record_post)."""
+    return _entry_index(state, '_our_post_ids')
+
+
+def get_voted_post_ids(state: dict) -> BoundedSet:
+    """Get set of post IDs we've already voted on (most recent VOTED_ID_MEMORY)."""
+    return _live_set(state, 'voted_post_ids')
+
+
+def get_voted_comment_ids(state: dict) -> BoundedSet:
+    """Get set of comment IDs we've already voted on (most recent VOTED_ID_MEMORY)."""
+    return _live_set(state, 'voted_comment_ids')
+
+
+def get_followed_agents(state: dict) -> set:
+    """Get set of agents we've followed."""
+    return _live_set(state, 'followed_agents')
+
+
+def get_profiles_checked(state: dict) -> set:
+    """Get set of agent profiles we've checked."""
+    return _live_set(state, 'profiles_checked')
+
+
+def get_subscribed_submolts(state: dict) -> set:
+    """Get set of submolts we've subscribed to."""
+    return _live_set(state, 'subscribed_submolts')
+
+
+def get_dm_contacted(state: dict) -> set:
+    """Get set of agents we've initiated DMs with."""
+    return _live_set(state, 'dm_contacted')
+
+
+def get_dm_conversations(state: dict) -> dict:
+    """Get dict of DM conversation states."""
+    return state.setdefault('dm_conversations', {})